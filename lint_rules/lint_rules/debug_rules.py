@@ -14,6 +14,10 @@ from loki import (
 )
 from loki.lint import GenericRule, RuleType
 
+
+__all__ = ['ArgSizeMismatchRule', 'DynamicUboundCheckRule']
+
+
 class ArgSizeMismatchRule(GenericRule):
     """
     Rule to check for argument size mismatch in subroutine/function calls
@@ -312,6 +316,3 @@ class DynamicUboundCheckRule(GenericRule):
                     node_map.update({decl: new_decls})
 
         return node_map
-
-# Create the __all__ property of the module to contain only the rule names
-__all__ = tuple(name for name in dir() if name.endswith('Rule') and name != 'GenericRule')
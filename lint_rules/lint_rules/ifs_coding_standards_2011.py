@@ -5,24 +5,31 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
-# pylint: disable=invalid-all-format
 """
 Implementation of rules in the IFS coding standards document (2011) for loki-lint.
 """
 
 from pathlib import Path
 import re
+import weakref
 
 from pymbolic.primitives import Expression
 
 from loki import (
     Visitor, FindNodes, ExpressionFinder, ExpressionRetriever,
-    flatten, as_tuple, strip_inline_comments, Module, Subroutine, BasicType, ir
+    as_tuple, strip_inline_comments, Module, Subroutine, BasicType, ir
 )
 from loki.lint import GenericRule, RuleType
 from loki.expression import symbols as sym
 
 
+__all__ = [
+    'CodeBodyRule', 'ModuleNamingRule', 'DrHookRule', 'LimitSubroutineStatementsRule',
+    'MaxDummyArgsRule', 'MplCdstringRule', 'ImplicitNoneRule', 'ExplicitKindRule',
+    'BannedStatementsRule', 'Fortran90OperatorsRule'
+]
+
+
 class CodeBodyRule(GenericRule):  # Coding standards 1.3
 
     type = RuleType.WARN
@@ -39,38 +46,44 @@ class CodeBodyRule(GenericRule):  # Coding standards 1.3
     }
 
     class NestingDepthVisitor(Visitor):
+        """
+        Visitor that yields all conditionals nested deeper than
+        :data:`max_nesting_depth`
+
+        The handlers are generators, such that results are propagated up
+        the tree without building and flattening intermediate lists.
+        """
 
         @classmethod
         def default_retval(cls):
-            return []
+            return ()
 
         def __init__(self, max_nesting_depth):
             super().__init__()
             self.max_nesting_depth = max_nesting_depth
 
-        def visit(self, o, *args, **kwargs):
-            return flatten(super().visit(o, *args, **kwargs))
+        def visit_tuple(self, o, **kwargs):
+            for c in o:
+                yield from self.visit(c, **kwargs)
+
+        visit_list = visit_tuple
 
         def visit_Conditional(self, o, **kwargs):
             level = kwargs.pop('level', 0)
-            too_deep = []
             if level >= self.max_nesting_depth and not getattr(o, 'inline', False):
-                too_deep = [o]
-            too_deep += self.visit(o.body, level=level + 1, **kwargs)
+                yield o
+            yield from self.visit(o.body, level=level + 1, **kwargs)
             if o.has_elseif:
-                too_deep += self.visit(o.else_body, level=level, **kwargs)
+                yield from self.visit(o.else_body, level=level, **kwargs)
             else:
-                too_deep += self.visit(o.else_body, level=level + 1, **kwargs)
-            return too_deep
+                yield from self.visit(o.else_body, level=level + 1, **kwargs)
 
         def visit_MultiConditional(self, o, **kwargs):
             level = kwargs.pop('level', 0)
-            too_deep = []
             if level >= self.max_nesting_depth and not getattr(o, 'inline', False):
-                too_deep = [o]
-            too_deep += self.visit(o.bodies, level=level + 1, **kwargs)
-            too_deep += self.visit(o.else_body, level=level + 1, **kwargs)
-            return too_deep
+                yield o
+            yield from self.visit(o.bodies, level=level + 1, **kwargs)
+            yield from self.visit(o.else_body, level=level + 1, **kwargs)
 
     @classmethod
     def check_subroutine(cls, subroutine, rule_report, config, **kwargs):
@@ -116,12 +129,38 @@ class DrHookRule(GenericRule):  # Coding standards 1.9
 
     non_exec_nodes = (ir.Comment, ir.CommentBlock, ir.Pragma, ir.PreprocessorDirective)
 
+    @staticmethod
+    def _is_symbol(expr, name):
+        """
+        Check if :data:`expr` is a plain symbol with the given upper-case
+        :data:`name`
+
+        This compares the symbol's name directly, instead of comparing the
+        expression to a string, which would invoke the string mapper.
+        """
+        return (
+            isinstance(expr, (sym.Scalar, sym.DeferredTypeSymbol, sym.ProcedureSymbol)) and
+            expr.name.upper() == name
+        )
+
+    @classmethod
+    def _iter_nodes(cls, ast, is_reversed=False):
+        """
+        Lazily iterate over the nodes in a (possibly nested) tuple of nodes,
+        optionally in reverse order, without flattening it first
+        """
+        for node in reversed(ast) if is_reversed else ast:
+            if isinstance(node, (tuple, list)):
+                yield from cls._iter_nodes(node, is_reversed=is_reversed)
+            else:
+                yield node
+
     @classmethod
     def _find_lhook_conditional(cls, ast, is_reversed=False):
         cond = None
-        for node in reversed(ast) if is_reversed else ast:
+        for node in cls._iter_nodes(ast, is_reversed=is_reversed):
             if isinstance(node, ir.Conditional):
-                if node.condition == 'LHOOK':
+                if cls._is_symbol(node.condition, 'LHOOK'):
                     cond = node
                     break
             elif not isinstance(node, cls.non_exec_nodes):
@@ -137,7 +176,7 @@ class DrHookRule(GenericRule):  # Coding standards 1.9
             # iterable but a single node (e.g., CallStatement)
             body = reversed(as_tuple(cond.body)) if is_reversed else as_tuple(cond.body)
             for node in body:
-                if isinstance(node, ir.CallStatement) and node.name == 'DR_HOOK':
+                if isinstance(node, ir.CallStatement) and cls._is_symbol(node.name, 'DR_HOOK'):
                     call = node
                 elif not isinstance(node, cls.non_exec_nodes):
                     # Break if executable statement encountered
@@ -146,22 +185,25 @@ class DrHookRule(GenericRule):  # Coding standards 1.9
 
     @staticmethod
     def _get_string_argument(scope):
-        string_arg = scope.name.upper()
+        # Collect the name components from the innermost scope outwards
+        # and join them once at the end
+        components = [scope.name.upper()]
         while hasattr(scope, 'parent') and scope.parent:
             scope = scope.parent
             if isinstance(scope, Subroutine):
-                string_arg = scope.name.upper() + '%' + string_arg
+                components += ['%', scope.name.upper()]
             elif isinstance(scope, Module):
-                string_arg = scope.name.upper() + ':' + string_arg
-        return string_arg
+                components += [':', scope.name.upper()]
+        return ''.join(reversed(components))
 
     @classmethod
-    def _check_lhook_call(cls, call, subroutine, rule_report, pos='First'):
+    def _check_lhook_call(cls, call, subroutine, rule_report, pos='First', string_arg=None):
         if call is None:
             msg = f'{pos} executable statement must be call to DR_HOOK'
             rule_report.add(msg, subroutine)
         elif call.arguments:
-            string_arg = cls._get_string_argument(subroutine)
+            if string_arg is None:
+                string_arg = cls._get_string_argument(subroutine)
             if not isinstance(call.arguments[0], sym.StringLiteral) or \
                     call.arguments[0].value.upper() != string_arg:
                 msg = f'String argument to DR_HOOK call should be "{string_arg}"'
@@ -171,7 +213,7 @@ class DrHookRule(GenericRule):  # Coding standards 1.9
                     str(call.arguments[1].value) == second_arg[pos]):
                 msg = f'Second argument to DR_HOOK call should be "{second_arg[pos]}"'
                 rule_report.add(msg, call)
-            if not (len(call.arguments) > 2 and call.arguments[2] == 'ZHOOK_HANDLE'):
+            if not (len(call.arguments) > 2 and cls._is_symbol(call.arguments[2], 'ZHOOK_HANDLE')):
                 msg = 'Third argument to DR_HOOK call should be "ZHOOK_HANDLE".'
                 rule_report.add(msg, call)
 
@@ -184,9 +226,9 @@ class DrHookRule(GenericRule):  # Coding standards 1.9
         ast = subroutine.body
         if isinstance(ast, ir.Section):
             ast = ast.body
-        ast = flatten(ast)
+        ast = as_tuple(ast)
 
-        # Look for conditionals in subroutine body
+        # Look for conditionals at the start and end of the subroutine body
         first_cond = cls._find_lhook_conditional(ast)
         last_cond = cls._find_lhook_conditional(ast, is_reversed=True)
 
@@ -194,8 +236,10 @@ class DrHookRule(GenericRule):  # Coding standards 1.9
         first_call = cls._find_lhook_call(first_cond)
         last_call = cls._find_lhook_call(last_cond, is_reversed=True)
 
-        cls._check_lhook_call(first_call, subroutine, rule_report)
-        cls._check_lhook_call(last_call, subroutine, rule_report, pos='Last')
+        # The expected string argument is the same for both calls
+        string_arg = cls._get_string_argument(subroutine) if first_call or last_call else None
+        cls._check_lhook_call(first_call, subroutine, rule_report, string_arg=string_arg)
+        cls._check_lhook_call(last_call, subroutine, rule_report, pos='Last', string_arg=string_arg)
 
 
 class LimitSubroutineStatementsRule(GenericRule):  # Coding standards 2.2
@@ -217,21 +261,26 @@ class LimitSubroutineStatementsRule(GenericRule):  # Coding standards 2.2
         ir.Deallocation, ir.Nullify, ir.CallStatement
     )
 
-    # Pattern for intrinsic nodes that are allowed as non-executable statements
-    match_non_exec_intrinsic_node = re.compile(r'\s*(?:PRINT|FORMAT)', re.I)
+    # Keywords of intrinsic nodes that are allowed as non-executable statements
+    non_exec_intrinsic_keywords = ('PRINT', 'FORMAT')
+    _non_exec_intrinsic_keyword_length = max(len(keyword) for keyword in non_exec_intrinsic_keywords)
+
+    @classmethod
+    def is_non_exec_intrinsic_node(cls, node):
+        '''Check if an intrinsic node starts with a non-executable keyword.'''
+        prefix = node.text.lstrip()[:cls._non_exec_intrinsic_keyword_length]
+        return prefix.upper().startswith(cls.non_exec_intrinsic_keywords)
 
     @classmethod
     def check_subroutine(cls, subroutine, rule_report, config, **kwargs):
         '''Count the number of nodes in the subroutine and check if they exceed
         a given maximum number.
         '''
-        # Count total number of executable nodes
-        nodes = FindNodes(cls.exec_nodes).visit(subroutine.ir)
-        num_nodes = len(nodes)
-        # Subtract number of non-exec intrinsic nodes
-        intrinsic_nodes = filter(lambda node: isinstance(node, ir.Intrinsic), nodes)
-        num_nodes -= sum(1 for _ in filter(
-            lambda node: cls.match_non_exec_intrinsic_node.match(node.text), intrinsic_nodes))
+        # Count executable nodes, skipping non-exec intrinsic nodes
+        num_nodes = 0
+        for node in FindNodes(cls.exec_nodes).visit(subroutine.ir):
+            if not (isinstance(node, ir.Intrinsic) and cls.is_non_exec_intrinsic_node(node)):
+                num_nodes += 1
 
         if num_nodes > config['max_num_statements']:
             msg = (f'Subroutine has {num_nodes} executable statements '
@@ -278,11 +327,9 @@ class MplCdstringRule(GenericRule):  # Coding standards 3.12
     def check_subroutine(cls, subroutine, rule_report, config, **kwargs):
         '''Check all calls to MPL subroutines for a CDSTRING.'''
         for call in FindNodes(ir.CallStatement).visit(subroutine.ir):
-            if str(call.name).upper().startswith('MPL_'):
-                for kw, _ in call.kwarguments:
-                    if kw.upper() == 'CDSTRING':
-                        break
-                else:
+            # Use the symbol's name directly to avoid invoking the string mapper
+            if call.name.name.upper().startswith('MPL_'):
+                if 'CDSTRING' not in {kw.upper() for kw, _ in call.kwarguments}:
                     msg = f'No "CDSTRING" provided in call to {call.name}'
                     rule_report.add(msg, call)
 
@@ -310,6 +357,27 @@ class ImplicitNoneRule(GenericRule):  # Coding standards 4.4
             return False
         return True
 
+    # Results of :meth:`check_for_implicit_none` for the specs of enclosing scopes
+    _scope_cache = {}
+
+    @classmethod
+    def check_scope_for_implicit_none(cls, spec):
+        """
+        Cached variant of :meth:`check_for_implicit_none` for the spec of an
+        enclosing scope, which is shared by all routines in that scope.
+
+        Results are cached per spec (by identity) and dropped when the spec
+        is garbage collected. A cached result is discarded if the spec's
+        body has been replaced since.
+        """
+        key = id(spec)
+        entry = cls._scope_cache.get(key)
+        if entry is None or entry[0]() is not spec or entry[1] is not spec.body:
+            ref = weakref.ref(spec, lambda _, key=key: cls._scope_cache.pop(key, None))
+            entry = (ref, spec.body, cls.check_for_implicit_none(spec))
+            cls._scope_cache[key] = entry
+        return entry[2]
+
     @classmethod
     def check_subroutine(cls, subroutine, rule_report, config, **kwargs):
         """
@@ -322,7 +390,7 @@ class ImplicitNoneRule(GenericRule):  # Coding standards 4.4
         scope = subroutine.parent
         while scope and not found_implicit_none:
             if hasattr(scope, 'spec') and scope.spec:
-                found_implicit_none = cls.check_for_implicit_none(scope.spec)
+                found_implicit_none = cls.check_scope_for_implicit_none(scope.spec)
             scope = scope.parent if hasattr(scope, 'parent') else None
 
         if not found_implicit_none:
@@ -362,7 +430,7 @@ class ExplicitKindRule(GenericRule):  # Coding standards 4.7
                     msg = f'{", ".join(str(var) for var in decl.symbols)} without explicit KIND declared'
                     rule_report.add(msg, decl)
                 elif allowed_type_kinds.get(decl_type.dtype):
-                    if decl_type.kind not in allowed_type_kinds[decl_type.dtype]:
+                    if str(decl_type.kind).upper().replace(' ', '') not in allowed_type_kinds[decl_type.dtype]:
                         # We have a KIND but it does not match any of the allowed kinds
                         msg = (f'{decl_type.kind!s} is not an allowed KIND value for '
                                f'{", ".join(str(var) for var in decl.symbols)}')
@@ -390,10 +458,11 @@ class ExplicitKindRule(GenericRule):  # Coding standards 4.7
             for literal in exprs:
                 if not literal.kind:
                     rule_report.add(f'{literal} used without explicit KIND', node)
-                elif allowed_type_kinds.get(literal.__class__):
-                    if str(literal.kind).upper() not in allowed_type_kinds[literal.__class__]:
-                        msg = f'{literal.kind} is not an allowed KIND value for {literal}'
-                        rule_report.add(msg, node)
+                    continue
+                allowed_kinds = allowed_type_kinds.get(literal.__class__)
+                if allowed_kinds and str(literal.kind).upper().replace(' ', '') not in allowed_kinds:
+                    msg = f'{literal.kind} is not an allowed KIND value for {literal}'
+                    rule_report.add(msg, node)
 
     @classmethod
     def check_subroutine(cls, subroutine, rule_report, config, **kwargs):
@@ -405,11 +474,12 @@ class ExplicitKindRule(GenericRule):  # Coding standards 4.7
         # When we check variable type information, we have BasicType values to identify
         # whether a variable is REAL, INTEGER, ... Therefore, we create a map that uses
         # the corresponding BasicType values as keys to look up allowed kinds for each type.
-        # Since the case does not matter, we convert all allowed type kinds to upper case.
+        # Since case and whitespace do not matter, we convert all allowed type kinds to upper
+        # case and remove any whitespace.
         types = tuple(BasicType.from_str(name) for name in config['declaration_types'])
         allowed_type_kinds = {}
         if config.get('allowed_type_kinds'):
-            allowed_type_kinds = {BasicType.from_str(name): [kind.upper() for kind in kinds]
+            allowed_type_kinds = {BasicType.from_str(name): frozenset(kind.upper().replace(' ', '') for kind in kinds)
                                   for name, kinds in config['allowed_type_kinds'].items()}
 
         cls.check_kind_declarations(subroutine, types, allowed_type_kinds, rule_report)
@@ -424,7 +494,7 @@ class ExplicitKindRule(GenericRule):  # Coding standards 4.7
                     'LOGICAL': sym.LogicLiteral, 'CHARACTER': sym.StringLiteral}
         types = tuple(type_map[name] for name in config['constant_types'])
         if config.get('allowed_type_kinds'):
-            allowed_type_kinds = {type_map[name]: [kind.upper() for kind in kinds]
+            allowed_type_kinds = {type_map[name]: frozenset(kind.upper().replace(' ', '') for kind in kinds)
                                   for name, kinds in config['allowed_type_kinds'].items()}
 
         cls.check_kind_literals(subroutine, types, allowed_type_kinds, rule_report)
@@ -448,9 +518,11 @@ class BannedStatementsRule(GenericRule):  # Coding standards 4.11
     @classmethod
     def check_subroutine(cls, subroutine, rule_report, config, **kwargs):
         '''Check for banned statements in intrinsic nodes.'''
+        banned = [(keyword, keyword.lower()) for keyword in config['banned']]
         for intr in FindNodes(ir.Intrinsic).visit(subroutine.ir):
-            for keyword in config['banned']:
-                if keyword.lower() in intr.text.lower():
+            text = intr.text.lower()
+            for keyword, keyword_lower in banned:
+                if keyword_lower in text:
                     rule_report.add(f'Banned keyword "{keyword}"', intr)
 
 
@@ -501,12 +573,22 @@ class Fortran90OperatorsRule(GenericRule):  # Coding standards 4.15
             only on :class:`pymbolic.primitives.Expression` children, collecting
             ``(node, expression root, comparison)`` tuples for all matches.
             """
+            return self._visit_children(o, o.children, **kwargs)
+
+        def _visit_children(self, o, children, **kwargs):
+            """
+            Collect the ``(node, expression root, comparison)`` tuples for
+            :data:`children` of :data:`o`, recursing directly into nested
+            tuples instead of flattening them first.
+            """
             retval = ()
-            for ch in flatten(o.children):
+            for ch in children:
                 if isinstance(ch, Expression):
                     comparisons = self.retriever.retrieve(ch)
                     if comparisons:
                         retval += ((o, ch, comparisons),)
+                elif isinstance(ch, (tuple, list)):
+                    retval += self._visit_children(o, ch, **kwargs)
                 elif ch is not None:
                     retval += self.visit(ch, **kwargs)
             return retval
@@ -533,18 +615,20 @@ class Fortran90OperatorsRule(GenericRule):  # Coding standards 4.15
             # Use the string representation of the expression to find the source line
             lstart, lend = node.source.find(str(expr_root))
             lines = node.source.clone_lines((lstart, lend))
+            # Strip comments from each line only once for all operators
+            stripped_lines = [strip_inline_comments(line.string) for line in lines]
 
             # For each comparison operator, use the original source code (because the frontends always
             # translate them to F90 operators) to check if F90 or F77 operators were used
             for op in sorted({op.operator for op in expr_list}):
                 # find source line for operator
                 op_str = op if op != '!=' else '/='
-                line = [line for line in lines if op_str in strip_inline_comments(line.string)]
-                if not line:
-                    line = [line for line in lines
-                            if op_str in strip_inline_comments(line.string.replace(cls._op_map[op_str], op_str))]
+                source_string = next((string for string in stripped_lines if op_str in string), None)
+                if source_string is None:
+                    idx = next(i for i, line in enumerate(lines)
+                               if op_str in strip_inline_comments(line.string.replace(cls._op_map[op_str], op_str)))
+                    source_string = stripped_lines[idx]
 
-                source_string = strip_inline_comments(line[0].string)
                 matches = cls._op_patterns[op].findall(source_string)
                 for f77, _ in matches:
                     if f77:
@@ -563,7 +647,3 @@ class Fortran90OperatorsRule(GenericRule):  # Coding standards 4.15
             new_expr.update_metadata({'source': None})
             mapper[report.location] = new_expr
         return mapper
-
-
-# Create the __all__ property of the module to contain only the rule names
-__all__ = tuple(name for name in dir() if name.endswith('Rule') and name != 'GenericRule')
@@ -10,7 +10,7 @@ from pathlib import Path
 import pytest
 
 from conftest import run_linter, available_frontends
-from loki import Sourcefile
+from loki import Sourcefile, Intrinsic
 from loki.lint import DefaultHandler
 
 
@@ -561,6 +561,37 @@ end module mod_also_not_okay
     assert sum('"contained_contained_routine_not_okay"' in msg for msg in messages) == 1
 
 
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_implicit_none_modified_scope(rules, frontend):
+    fcode = """
+module mod_not_okay
+integer :: x
+contains
+subroutine routine_a
+integer :: a
+a = 5
+end subroutine routine_a
+subroutine routine_b
+integer :: b
+b = 5
+end subroutine routine_b
+end module mod_not_okay
+    """
+    source = Sourcefile.from_source(fcode, frontend=frontend)
+    messages = []
+    handler = DefaultHandler(target=messages.append)
+    _ = run_linter(source, [rules.ImplicitNoneRule], handlers=[handler])
+    assert len(messages) == 2
+    assert sum('"routine_a"' in msg for msg in messages) == 1
+    assert sum('"routine_b"' in msg for msg in messages) == 1
+
+    # Adding IMPLICIT NONE to the module must not be masked by a cached result
+    source['mod_not_okay'].spec.prepend(Intrinsic(text='IMPLICIT NONE'))
+    messages.clear()
+    _ = run_linter(source, [rules.ImplicitNoneRule], handlers=[handler])
+    assert not messages
+
+
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_explicit_kind(rules, frontend):
     fcode = """
@@ -619,6 +650,33 @@ end subroutine routine_not_okay
         assert all(kw in msg for kw in keys if kw is not None)
 
 
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_explicit_kind_whitespace(rules, frontend):
+    '''Test that allowed kinds are compared irrespective of case and whitespace.'''
+    fcode = """
+subroutine routine_kind_expressions
+integer(kind=selected_int_kind(9)) :: i
+real(kind=selected_real_kind(13, 300)) :: a
+real(kind=selected_real_kind(6, 37)) :: b
+
+a = 2.0_jprb
+b = 3.0_jprb
+end subroutine routine_kind_expressions
+    """.strip()
+    source = Sourcefile.from_source(fcode, frontend=frontend)
+    messages = []
+    handler = DefaultHandler(target=messages.append)
+    config = {'ExplicitKindRule': {'allowed_type_kinds': {
+        'INTEGER': ['SELECTED_INT_KIND( 9 )'],
+        'REAL': ['JPRB', 'SELECTED_REAL_KIND(13,300)']
+    }}}
+    _ = run_linter(source, [rules.ExplicitKindRule], config=config, handlers=[handler])
+
+    assert len(messages) == 1
+    keywords = ('ExplicitKindRule', '[4.7]', 'not an allowed KIND value for b', '(l. 4)')
+    assert all(keyword in messages[0] for keyword in keywords)
+
+
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_banned_statements_default(rules, frontend):
     '''Test for banned statements with default.'''
@@ -675,6 +733,29 @@ end subroutine banned_statements
     assert all(all(keyword in msg for keyword in keywords) for msg in messages)
 
 
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_banned_statements_overlapping(rules, frontend):
+    '''Test for banned statements with keywords that share a common prefix.'''
+    fcode = """
+subroutine banned_statements()
+integer :: dummy
+
+dummy = 5
+go to 100
+100 continue
+end subroutine banned_statements
+    """
+    source = Sourcefile.from_source(fcode, frontend=frontend)
+    messages = []
+    handler = DefaultHandler(target=messages.append)
+    config = {'BannedStatementsRule': {'banned': ['GO', 'GO TO']}}
+    _ = run_linter(source, [rules.BannedStatementsRule], config=config, handlers=[handler])
+
+    assert len(messages) == 2
+    assert any('"GO"' in msg for msg in messages)
+    assert any('"GO TO"' in msg for msg in messages)
+
+
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_fortran_90_operators(rules, frontend):
     '''Test for existence of non Fortran 90 comparison operators.'''
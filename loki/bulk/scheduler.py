@@ -551,13 +551,17 @@ class Scheduler:
         """
         Enrich subroutine calls for inter-procedural transformations
         """
+        # Build the map of all routines in the call tree only once
+        routines = self.routines
+        routine_map = CaseInsensitiveDict((r.name, r) for r in routines)
+
         # Force the parsing of the routines in the call tree
         for item in self.item_graph:
             if not isinstance(item, SubroutineItem):
                 continue
 
             # Enrich with all routines in the call tree
-            item.routine.enrich_calls(routines=self.routines)
+            item.routine.enrich_calls(routines=routines, routine_map=routine_map)
             item.routine.enrich_types(typedefs=self.typedefs)
 
             # Enrich item with meta-info from outside of the callgraph
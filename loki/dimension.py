@@ -5,6 +5,8 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+from functools import cached_property
+
 from loki.tools import as_tuple
 
 __all__ = ['Dimension']
@@ -72,12 +74,14 @@ class Dimension:
         """
         return f'{self._bounds[0]}:{self._bounds[1]}'
 
-    @property
+    @cached_property
     def size_expressions(self):
         """
         A list of all expression strings representing the size of a data space.
 
         This includes generic aliases, like ``end - start + 1`` or ``1:size`` ranges.
+        The tuple is built on first access and cached, as the attributes it
+        is derived from do not change over the lifetime of the object.
         """
         exprs = as_tuple(self.size)
         if self._aliases:
@@ -15,6 +15,7 @@ from collections import OrderedDict
 from dataclasses import dataclass
 from functools import partial
 from itertools import chain
+from operator import attrgetter
 from typing import Any, Tuple, Union
 
 from pymbolic.primitives import Expression
@@ -95,7 +96,21 @@ class Node:
         """
         The traversable children of the node.
         """
-        return tuple(getattr(self, i) for i in self._traversable)
+        cls = type(self)
+        try:
+            getter = cls.__dict__['_children_getter']
+        except KeyError:
+            # Create the attribute getter once per class
+            if len(cls._traversable) == 1:
+                # attrgetter returns a plain value for a single attribute name
+                getter = lambda o, _get=attrgetter(cls._traversable[0]): (_get(o),)
+            elif cls._traversable:
+                getter = attrgetter(*cls._traversable)
+            else:
+                getter = lambda o: ()
+            # Note: always look this up via the class __dict__ to avoid method binding
+            cls._children_getter = getter
+        return getter(self)
 
     def _rebuild(self, *args, **kwargs):
         """
@@ -114,10 +129,14 @@ class Node:
             The non-traversable arguments used to create the node, By
             default, ``args_frozen`` are used.
         """
-        handle = self.args
-        argnames = [i for i in self._traversable if i not in kwargs]
-        handle.update(OrderedDict(zip(argnames, args)))
+        argnames = [i for i in self._traversable if i not in kwargs] if kwargs else self._traversable
+        handle = dict(zip(argnames, args))
         handle.update(kwargs)
+        # Fill in all remaining arguments from the current node
+        current = self.__dict__
+        for k in self._argnames():
+            if k not in handle and k in current:
+                handle[k] = current[k]
         return type(self)(**handle)
 
     clone = _rebuild
@@ -137,23 +156,54 @@ class Node:
             default, ``args_frozen`` are used.
 
         """
-        argnames = [i for i in self._traversable if i not in kwargs]
+        argnames = [i for i in self._traversable if i not in kwargs] if kwargs else self._traversable
         kwargs.update(zip(argnames, args))
         self.__dict__.update(kwargs)
 
+    @classmethod
+    def _argnames(cls):
+        """
+        The names of the arguments used to construct nodes of this type.
+
+        These are derived from the dataclass fields once per class and
+        cached, as they do not change at runtime.
+        """
+        try:
+            return cls.__dict__['_argnames_cache']
+        except KeyError:
+            argnames = tuple(cls.__dataclass_fields__.keys())  # pylint: disable=no-member
+            frozen_argnames = tuple(k for k in argnames if k not in cls._traversable)
+            cls._argnames_cache = argnames
+            cls._frozen_argnames_cache = frozen_argnames
+            return argnames
+
+    @classmethod
+    def _frozen_argnames(cls):
+        """
+        The names of the arguments used to construct nodes of this type
+        that cannot be traversed.
+        """
+        try:
+            return cls.__dict__['_frozen_argnames_cache']
+        except KeyError:
+            cls._argnames()
+            return cls.__dict__['_frozen_argnames_cache']
+
     @property
     def args(self):
         """
         Arguments used to construct the Node.
         """
-        return {k: v for k, v in self.__dict__.items() if k in self.__dataclass_fields__.keys()}  # pylint: disable=no-member
+        handle = self.__dict__
+        return {k: handle[k] for k in self._argnames() if k in handle}
 
     @property
     def args_frozen(self):
         """
         Arguments used to construct the Node that cannot be traversed.
         """
-        return {k: v for k, v in self.args.items() if k not in self._traversable}
+        handle = self.__dict__
+        return {k: handle[k] for k in self._frozen_argnames() if k in handle}
 
     def __repr__(self):
         raise NotImplementedError
@@ -270,14 +320,20 @@ class ScopedNode(Scope):
     is carried over correctly.
     """
 
-    @property
-    def args(self):
+    @classmethod
+    def _argnames(cls):
         """
-        Arguments used to construct the :any:`ScopedNode`, excluding
-        the symbol table.
+        The names of the arguments used to construct the :any:`ScopedNode`,
+        excluding the symbol table.
         """
-        keys = tuple(k for k in self.__dataclass_fields__.keys() if k not in ('symbol_attrs', ))  # pylint: disable=no-member
-        return {k: v for k, v in self.__dict__.items() if k in keys}
+        try:
+            return cls.__dict__['_argnames_cache']
+        except KeyError:
+            argnames = tuple(k for k in cls.__dataclass_fields__.keys() if k != 'symbol_attrs')  # pylint: disable=no-member
+            frozen_argnames = tuple(k for k in argnames if k not in cls._traversable)  # pylint: disable=no-member
+            cls._argnames_cache = argnames
+            cls._frozen_argnames_cache = frozen_argnames
+            return argnames
 
     def _update(self, *args, **kwargs):
         if 'symbol_attrs' not in kwargs:
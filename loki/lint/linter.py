@@ -376,6 +376,11 @@ def lint_files(rules, config, handlers=None):
     The ``include`` and ``exclude`` options are provided to :any:`find_paths` to
     discover files that should be linted.
 
+    With glob-based file discovery, ``max_workers`` allows checking multiple
+    files in parallel. Parallelism is applied per file rather than per
+    routine, as rules are cheap compared to the cost of transferring the IR
+    of individual routines to worker processes and merging the reports.
+
     Parameters
     ----------
     rules : list of :any:`GenericRule` or a Python module
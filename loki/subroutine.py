@@ -21,6 +21,45 @@ from loki.types import BasicType, ProcedureType, DerivedType, SymbolAttributes
 __all__ = ['Subroutine']
 
 
+class InterfaceSpecTransformer(Transformer):
+    """
+    Bespoke transformer that builds the spec of a :any:`Subroutine`'s
+    interface in a single pass over the original spec.
+
+    Declarations of dummy arguments are replicated with symbols re-scoped to
+    the interface routine, all other (local) declarations are removed.
+    Declarations inside nested scopes (e.g., derived type definitions)
+    remain untouched.
+
+    Parameters
+    ----------
+    arg_names : set of str
+        The names of the dummy arguments.
+    routine : :any:`Subroutine`
+        The interface routine to which symbols are re-scoped.
+    """
+
+    def __init__(self, arg_names, routine, **kwargs):
+        super().__init__(**kwargs)
+        self.arg_names = arg_names
+        self.routine = routine
+
+    def visit_VariableDeclaration(self, o, **kwargs):
+        if 'scope' in kwargs:
+            # Declaration in a nested scope
+            return self.visit_Node(o, **kwargs)
+
+        if any(v.name in self.arg_names for v in o.symbols):
+            assert all(v.name in self.arg_names and v.type.intent is not None for v in o.symbols), \
+                "Declarations must have intents and dummy and local arguments cannot be mixed."
+            # Replicate declaration with re-scoped variables
+            variables = as_tuple(v.clone(scope=self.routine) for v in o.symbols)
+            return o.clone(symbols=variables)
+        return None  # Remove local variable declarations
+
+    visit_ProcedureDeclaration = visit_VariableDeclaration
+
+
 class Subroutine(ProgramUnit):
     """
     Class to handle and manipulate a single subroutine.
@@ -95,7 +134,7 @@ class Subroutine(ProgramUnit):
             body=None, args=None, prefix=None, bind=None, result_name=None, is_function=False,
     ):
         # First, store additional Subroutine-specific properties
-        self._dummies = as_tuple(a.lower() for a in as_tuple(args))  # Order of dummy arguments
+        self._dummies = tuple(a.lower() for a in as_tuple(args))  # Order of dummy arguments
         self.prefix = as_tuple(prefix)
         self.bind = bind
         self.result_name = result_name
@@ -136,22 +175,21 @@ class Subroutine(ProgramUnit):
         for alloc in FindNodes(ir.Allocation).visit(body):
             for v in alloc.variables:
                 if isinstance(v, sym.Array):
-                    if alloc.data_source:
-                        alloc_map[v.name.lower()] = alloc.data_source.type.shape
-                    else:
-                        alloc_map[v.name.lower()] = v.dimensions
+                    alloc_map[v.name.lower()] = alloc.data_source.type.shape if alloc.data_source else v.dimensions
+        if not alloc_map:
+            return spec, body
+
+        # Collect the affected variables from spec and body in a single traversal
         vmap = {}
-        for v in FindVariables().visit(body):
-            if v.name.lower() in alloc_map:
-                vtype = v.type.clone(shape=alloc_map[v.name.lower()])
-                vmap[v] = v.clone(type=vtype)
-        smap = {}
-        for v in FindVariables().visit(spec):
-            if v.name.lower() in alloc_map:
-                vtype = v.type.clone(shape=alloc_map[v.name.lower()])
-                smap[v] = v.clone(type=vtype)
-        return (SubstituteExpressions(smap, invalidate_source=False).visit(spec),
-                SubstituteExpressions(vmap, invalidate_source=False).visit(body))
+        for v in FindVariables().visit((spec, body)):
+            name = v.name.lower()
+            if name in alloc_map:
+                vmap[v] = v.clone(type=v.type.clone(shape=alloc_map[name]))
+        if not vmap:
+            return spec, body
+
+        transformer = SubstituteExpressions(vmap, invalidate_source=False)
+        return transformer.visit(spec), transformer.visit(body)
 
     @classmethod
     def from_omni(cls, ast, raw_source, definitions=None, parent=None, type_map=None):
@@ -351,8 +389,8 @@ class Subroutine(ProgramUnit):
         super(self.__class__, self.__class__).variables.__set__(self, variables)
 
         # Filter the dummy list in case we removed an argument
-        varnames = [str(v.name).lower() for v in variables]
-        self._dummies = as_tuple(arg for arg in self._dummies if str(arg).lower() in varnames)
+        varnames = frozenset(str(v.name).lower() for v in variables)
+        self._dummies = as_tuple(arg for arg in self._dummies if arg in varnames)
 
     @property
     def arguments(self):
@@ -364,7 +402,10 @@ class Subroutine(ProgramUnit):
         #Note that if the map is not loaded, Python will recreate it for every arguement,
         #resulting in a large overhead.
         symbol_map = self.symbol_map
-        return as_tuple(symbol_map.get(arg, sym.Variable(name=arg)) for arg in self._dummies)
+        return as_tuple(
+            symbol_map[arg] if arg in symbol_map else sym.Variable(name=arg)
+            for arg in self._dummies
+        )
 
     @arguments.setter
     def arguments(self, arguments):
@@ -375,20 +416,22 @@ class Subroutine(ProgramUnit):
         """
         # FIXME: This will fail if one of the argument is declared via an interface!
 
-        # First map variables to existing declarations
-        declarations = FindNodes((ir.VariableDeclaration, ir.ProcedureDeclaration)).visit(self.spec)
-        decl_map = dict((v, decl) for decl in declarations for v in decl.symbols)
+        # First collect variables with existing declarations
+        declared = {v.name.lower() for decl in self.declarations for v in decl.symbols}
 
         arguments = as_tuple(arguments)
+        new_decls = []
         for arg in arguments:
-            if arg not in decl_map:
-                # By default, append new variables to the end of the spec
+            if arg.name.lower() not in declared:
                 assert arg.type.intent is not None
                 if isinstance(arg.type, ProcedureType):
-                    new_decl = ir.ProcedureDeclaration(symbols=(arg, ))
+                    new_decls.append(ir.ProcedureDeclaration(symbols=(arg, )))
                 else:
-                    new_decl = ir.VariableDeclaration(symbols=(arg, ))
-                self.spec.append(new_decl)
+                    new_decls.append(ir.VariableDeclaration(symbols=(arg, )))
+
+        if new_decls:
+            # By default, append new variables to the end of the spec
+            self.spec.append(as_tuple(new_decls))
 
         # Set new dummy list according to input
         self._dummies = as_tuple(arg.name.lower() for arg in arguments)
@@ -398,7 +441,8 @@ class Subroutine(ProgramUnit):
         """
         Return names of arguments in order of the defined signature (dummy list)
         """
-        return [a.name for a in self.arguments]
+        symbol_map = self.symbol_map
+        return [symbol_map[arg].name if arg in symbol_map else arg for arg in self._dummies]
 
     members = ProgramUnit.subroutines
 
@@ -419,20 +463,10 @@ class Subroutine(ProgramUnit):
         # and duplicate all argument symbols within a new subroutine scope
         arg_names = [arg.name for arg in self.arguments]
         routine = Subroutine(name=self.name, args=arg_names, spec=None, body=None)
-        decl_map = {}
-        for decl in FindNodes((ir.VariableDeclaration, ir.ProcedureDeclaration)).visit(self.spec):
-            if any(v.name in arg_names for v in decl.symbols):
-                assert all(v.name in arg_names and v.type.intent is not None for v in decl.symbols), \
-                    "Declarations must have intents and dummy and local arguments cannot be mixed."
-                # Replicate declaration with re-scoped variables
-                variables = as_tuple(v.clone(scope=routine) for v in decl.symbols)
-                decl_map[decl] = decl.clone(symbols=variables)
-            else:
-                decl_map[decl] = None  # Remove local variable declarations
-        routine.spec = Transformer(decl_map).visit(self.spec)
+        routine.spec = InterfaceSpecTransformer(set(arg_names), routine).visit(self.spec)
         return ir.Interface(body=(routine,))
 
-    def enrich_calls(self, routines):
+    def enrich_calls(self, routines, routine_map=None):
         """
         Update :any:`SymbolAttributes` for the ``name`` property of
         :any:`CallStatement` nodes to provide links to the :any:`Subroutine`
@@ -442,14 +476,27 @@ class Subroutine(ProgramUnit):
         ----------
         routines : (list of) :any:`Subroutine`
             Possible targets of :any:`CallStatement` calls
+        routine_map : :any:`CaseInsensitiveDict`, optional
+            Pre-built map of names to the objects in :data:`routines`. This
+            allows callers that enrich many routines with the same set of
+            targets to build the map only once.
         """
-        routine_map = CaseInsensitiveDict((r.name, r) for r in as_tuple(routines))
+        if routine_map is None:
+            routine_map = CaseInsensitiveDict((r.name, r) for r in as_tuple(routines))
+
+        # Nodes declared in interface blocks, collected on first use
+        interface_nodes = None
 
         with pragmas_attached(self, ir.CallStatement, attach_pragma_post=False):
-            for call in FindNodes(ir.CallStatement).visit(self.body):
-                name = str(call.name)
-                # Calls marked as 'reference' are inactive and thus skipped
-                not_active = is_loki_pragma(call.pragma, starts_with='reference')
+            calls = FindNodes(ir.CallStatement).visit(self.body)
+            # Calls marked as 'reference' are inactive and thus skipped (only calls with
+            # an attached pragma need to be checked)
+            calls_not_active = [
+                bool(call.pragma) and is_loki_pragma(call.pragma, starts_with='reference') for call in calls
+            ]
+
+            for call, not_active in zip(calls, calls_not_active):
+                name = call.name.name
 
                 # Update symbol table if necessary and present in routine_map
                 routine = routine_map.get(name)
@@ -468,7 +515,9 @@ class Subroutine(ProgramUnit):
                     )
                     if update_symbol:
                         # Remove existing symbol from symbol table if defined in interface block
-                        for node in [node for intf in self.interfaces for node in intf.body]:
+                        if interface_nodes is None:
+                            interface_nodes = [node for intf in self.interfaces for node in intf.body]
+                        for node in interface_nodes:
                             if getattr(node, 'name', None) == call.name:
                                 if node.parent == self:
                                     node.parent = None
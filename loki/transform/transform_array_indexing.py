@@ -148,14 +148,21 @@ def normalize_range_indexing(routine):
     def is_one_index(dim):
         return isinstance(dim, sym.RangeIndex) and dim.lower == 1 and dim.step is None
 
+    variables = routine.variables
     vmap = {}
-    for v in routine.variables:
+    for v in variables:
         if isinstance(v, sym.Array):
+            if not any(is_one_index(d) for d in v.dimensions + as_tuple(v.shape)):
+                # Already normalized, no need to rebuild the symbol
+                continue
             new_dims = [d.upper if is_one_index(d) else d for d in v.dimensions]
             new_shape = [d.upper if is_one_index(d) else d for d in v.shape]
             new_type = v.type.clone(shape=as_tuple(new_shape))
             vmap[v] = v.clone(dimensions=as_tuple(new_dims), type=new_type)
-    routine.variables = [vmap.get(v, v) for v in routine.variables]
+
+    # Update declarations only if any of them changed
+    if vmap:
+        routine.variables = [vmap.get(v, v) for v in variables]
 
 
 def promote_variables(routine, variable_names, pos, index=None, size=None):
@@ -26,9 +26,9 @@ from loki.transform.transform_array_indexing import (
     promotion_dimensions_from_loop_nest, promote_nonmatching_variables
 )
 from loki.tools import (
-    flatten, as_tuple, CaseInsensitiveDict, binary_insertion_sort, optional
+    flatten, as_tuple, CaseInsensitiveDict, optional
 )
-from loki.visitors import FindNodes, Transformer, NestedMaskedTransformer, is_parent_of
+from loki.visitors import FindNodes, FindScopes, Transformer, NestedMaskedTransformer
 from loki.analyse import (
     dataflow_analysis_attached, read_after_write_vars, loop_carried_dependencies
 )
@@ -55,8 +55,9 @@ class Polyhedron:
     """
 
     def __init__(self, A, b, variables=None):
-        A = np.array(A, dtype=np.dtype(int))
-        b = np.array(b, dtype=np.dtype(int))
+        # Avoid copying arrays that are already of the right type, as created internally
+        A = np.asarray(A, dtype=np.dtype(int))
+        b = np.asarray(b, dtype=np.dtype(int))
         assert A.ndim == 2 and b.ndim == 1
         assert A.shape[0] == b.shape[0]
         self.A = A
@@ -64,10 +65,12 @@ class Polyhedron:
 
         self.variables = None
         self.variable_names = None
+        self._variable_index = None
         if variables is not None:
             assert len(variables) == A.shape[1]
             self.variables = variables
             self.variable_names = [v.name.lower() for v in self.variables]
+            self._variable_index = {name: i for i, name in enumerate(self.variable_names)}
 
     def variable_to_index(self, variable):
         if self.variable_names is None:
@@ -75,7 +78,9 @@ class Polyhedron:
         if isinstance(variable, TypedSymbol):
             variable = variable.name.lower()
         assert isinstance(variable, str)
-        return self.variable_names.index(variable)
+        if variable not in self._variable_index:
+            raise ValueError(f'{variable} is not a variable of the polyhedron')
+        return self._variable_index[variable]
 
     @staticmethod
     def _to_literal(value):
@@ -83,6 +88,49 @@ class Polyhedron:
             return sym.Product((-1, sym.IntLiteral(abs(value))))
         return sym.IntLiteral(value)
 
+    def _bounds(self, index_or_variable, sign, ignore_variables=None):
+        """
+        Return all bounds imposed on a variable by constraints in which the
+        variable has a coefficient with the given sign.
+
+        This implements :meth:`lower_bounds` (``sign=-1``) and
+        :meth:`upper_bounds` (``sign=1``).
+        """
+        if isinstance(index_or_variable, int):
+            j = index_or_variable
+        else:
+            j = self.variable_to_index(index_or_variable)
+
+        if ignore_variables:
+            ignore_variables = [i if isinstance(i, int) else self.variable_to_index(i)
+                                for i in ignore_variables]
+
+        # Work on Python integers to avoid the overhead of indexing numpy arrays element-wise
+        A, b = self.A.tolist(), self.b.tolist()
+
+        mask = np.sign(self.A[:,j]) == sign
+        if ignore_variables:
+            # Skip constraints that depend on any of the ignored variables
+            mask &= ~np.any(self.A[:,ignore_variables] != 0, axis=1)
+
+        bounds = []
+        for i in np.flatnonzero(mask):
+            row = A[i]
+            components = [self._to_literal(a_ik) * self.variables[k]
+                          for k, a_ik in enumerate(row) if k != j and a_ik != 0]
+            if not components and b[i] % row[j] == 0:
+                # Constant integer bound: fold directly instead of calling simplify
+                bounds += [self._to_literal(b[i] // row[j])]
+                continue
+            if not components:
+                lhs = sym.IntLiteral(0)
+            elif len(components) == 1:
+                lhs = components[0]
+            else:
+                lhs = sym.Sum(as_tuple(components))
+            bounds += [simplify(sym.Quotient(self._to_literal(b[i]) - lhs, self._to_literal(row[j])))]
+        return bounds
+
     def lower_bounds(self, index_or_variable, ignore_variables=None):
         """
         Return all lower bounds imposed on a variable.
@@ -101,33 +149,7 @@ class Polyhedron:
 
         :returns list: the bounds for that variable.
         """
-        if isinstance(index_or_variable, int):
-            j = index_or_variable
-        else:
-            j = self.variable_to_index(index_or_variable)
-
-        if ignore_variables:
-            ignore_variables = [i if isinstance(i, int) else self.variable_to_index(i)
-                                for i in ignore_variables]
-
-        bounds = []
-        for i in range(self.A.shape[0]):
-            if self.A[i,j] < 0:
-                if ignore_variables and any(self.A[i, k] != 0 for k in ignore_variables):
-                    # Skip constraint that depends on any of the ignored variables
-                    continue
-
-                components = [self._to_literal(self.A[i,k]) * self.variables[k]
-                              for k in range(self.A.shape[1]) if k != j and self.A[i,k] != 0]
-                if not components:
-                    lhs = sym.IntLiteral(0)
-                elif len(components) == 1:
-                    lhs = components[0]
-                else:
-                    lhs = sym.Sum(as_tuple(components))
-                bounds += [simplify(sym.Quotient(self._to_literal(self.b[i]) - lhs,
-                                                 self._to_literal(self.A[i,j])))]
-        return bounds
+        return self._bounds(index_or_variable, -1, ignore_variables)
 
     def upper_bounds(self, index_or_variable, ignore_variables=None):
         """
@@ -147,36 +169,10 @@ class Polyhedron:
 
         :returns list: the bounds for that variable.
         """
-        if isinstance(index_or_variable, int):
-            j = index_or_variable
-        else:
-            j = self.variable_to_index(index_or_variable)
-
-        if ignore_variables:
-            ignore_variables = [i if isinstance(i, int) else self.variable_to_index(i)
-                                for i in ignore_variables]
-
-        bounds = []
-        for i in range(self.A.shape[0]):
-            if self.A[i,j] > 0:
-                if ignore_variables and any(self.A[i, k] != 0 for k in ignore_variables):
-                    # Skip constraint that depends on any of the ignored variables
-                    continue
-
-                components = [self._to_literal(self.A[i,k]) * self.variables[k]
-                              for k in range(self.A.shape[1]) if k != j and self.A[i,k] != 0]
-                if not components:
-                    lhs = sym.IntLiteral(0)
-                elif len(components) == 1:
-                    lhs = components[0]
-                else:
-                    lhs = sym.Sum(as_tuple(components))
-                bounds += [simplify(sym.Quotient(self._to_literal(self.b[i]) - lhs,
-                                                 self._to_literal(self.A[i,j])))]
-        return bounds
+        return self._bounds(index_or_variable, 1, ignore_variables)
 
     @staticmethod
-    def generate_entries_for_lower_bound(bound, variables, index):
+    def generate_entries_for_lower_bound(bound, variables, index, out=None):
         """
         Helper routine to generate matrix and right-hand side entries for a
         given lower bound.
@@ -188,23 +184,36 @@ class Polyhedron:
         right-hand side with -1.
 
         :param bound: the expression representing the lower bound.
-        :param list variables: the list of variable names.
+        :param variables: the list of variables or variable names, or a mapping
+                    of (lower case) variable names to their index.
+        :type variables: list or dict
         :param int index: the index of the variable constrained by this bound.
+        :param np.array out: optional zero-initialised row of the matrix into which
+                    the left-hand side entries are written directly.
 
         :return: the pair ``(lhs, rhs)`` of the row in the matrix inequality.
+                 Without :data:`out`, ``lhs`` is a new matrix of shape
+                 ``(1, len(variables))``; otherwise it is :data:`out` itself,
+                 i.e., the 1D row filled in place.
         :rtype: tuple(np.array, np.array)
         """
         supported_types = (sym.TypedSymbol, sym.MetaSymbol, sym.Sum, sym.Product)
         if not (is_constant(bound) or isinstance(bound, supported_types)):
             raise ValueError(f'Cannot derive inequality from bound {str(bound)}')
+        if not isinstance(variables, dict):
+            variables = {getattr(v, 'name', v).lower(): i for i, v in enumerate(variables)}
         summands = accumulate_polynomial_terms(bound)
         b = -summands.pop(1, 0)  # Constant term or 0
-        A = np.zeros([1, len(variables)], dtype=np.dtype(int))
-        A[0, index] = -1
+        if out is None:
+            A = np.zeros([1, len(variables)], dtype=np.dtype(int))
+            row = A[0]
+        else:
+            A = row = out
+        row[index] = -1
         for base, coef in summands.items():
             if not len(base) == 1:
                 raise ValueError(f'Non-affine bound {str(bound)}')
-            A[0, variables.index(base[0].name.lower())] = coef
+            row[variables[base[0].name.lower()]] = coef
         return A, b
 
     @classmethod
@@ -216,11 +225,11 @@ class Polyhedron:
 
         # Add any variables that are not loop variables to the vector of variables
         variables = list(loop_variables)
-        variable_names = [v.name.lower() for v in variables]
+        variable_index = {v.name.lower(): i for i, v in enumerate(variables)}
         for v in sorted(FindVariables().visit(loop_ranges), key=lambda v: v.name.lower()):
-            if v.name.lower() not in variable_names:
+            if v.name.lower() not in variable_index:
+                variable_index[v.name.lower()] = len(variables)
                 variables += [v]
-                variable_names += [v.name.lower()]
 
         n = 2 * len(loop_ranges)
         d = len(variables)
@@ -229,16 +238,14 @@ class Polyhedron:
 
         for i, (loop_variable, loop_range) in enumerate(zip(loop_variables, loop_ranges)):
             assert loop_range.step is None or loop_range.step == '1'
-            j = variables.index(loop_variable.name.lower())
+            j = variable_index[loop_variable.name.lower()]
 
             # Create inequality from lower bound
-            lhs, rhs = cls.generate_entries_for_lower_bound(loop_range.start, variable_names, j)
-            A[2*i,:] = lhs
-            b[2*i] = rhs
+            _, b[2*i] = cls.generate_entries_for_lower_bound(loop_range.start, variable_index, j, out=A[2*i])
 
             # Create inequality from upper bound
-            lhs, rhs = cls.generate_entries_for_lower_bound(loop_range.stop, variable_names, j)
-            A[2*i+1,:] = -lhs
+            _, rhs = cls.generate_entries_for_lower_bound(loop_range.stop, variable_index, j, out=A[2*i+1])
+            A[2*i+1] *= -1
             b[2*i+1] = -rhs
 
         return cls(A, b, variables)
@@ -266,33 +273,31 @@ def eliminate_variable(polyhedron, index_or_variable):
     else:
         j = polyhedron.variable_to_index(index_or_variable)
 
+    column = polyhedron.A[:,j]
     # Indices of lower bounds on x_j
-    L = [i for i in range(polyhedron.A.shape[0]) if polyhedron.A[i,j] < 0]
+    L = np.flatnonzero(column < 0)
     # Indices of upper bounds on x_j
-    U = [i for i in range(polyhedron.A.shape[0]) if polyhedron.A[i,j] > 0]
+    U = np.flatnonzero(column > 0)
     # Indices of constraints not involving x_j
-    Z = [i for i in range(polyhedron.A.shape[0]) if i not in L+U]
+    Z = np.flatnonzero(column == 0)
     # Cartesian product of lower and upper bounds
-    R = [(l, u) for l in L for u in U]
-
-    # Project polyhedron onto hyperplane H:={x|x_j = 0}
-    A = np.zeros(polyhedron.A.shape, dtype=np.dtype(int))
-    b = np.zeros(polyhedron.b.shape, dtype=np.dtype(int))
-    next_constraint = 0
-    for idx in Z:
-        A[next_constraint,:] = polyhedron.A[idx,:]
-        b[next_constraint] = polyhedron.b[idx]
-        next_constraint += 1
-    for l, u in R:
-        A[next_constraint,:] = polyhedron.A[u,j] * polyhedron.A[l,:] - polyhedron.A[l,j] * polyhedron.A[u,:]
-        b[next_constraint] = polyhedron.A[u,j] * polyhedron.b[l] - polyhedron.A[l,j] * polyhedron.b[u]
-        next_constraint += 1
+    R_l, R_u = (idx.ravel() for idx in np.meshgrid(L, U, indexing='ij'))
+
+    # Project polyhedron onto hyperplane H:={x|x_j = 0}. The j-th column is zero
+    # in all resulting constraints, thus we eliminate it before combining rows
+    A_l, A_u = polyhedron.A[R_l,j], polyhedron.A[R_u,j]
+    A_reduced = np.delete(polyhedron.A, j, axis=1)
+    A = np.concatenate((
+        A_reduced[Z,:],
+        A_u[:,None] * A_reduced[R_l,:] - A_l[:,None] * A_reduced[R_u,:]
+    ))
+    b = np.concatenate((
+        polyhedron.b[Z],
+        A_u * polyhedron.b[R_l] - A_l * polyhedron.b[R_u]
+    ))
 
     # TODO: normalize rows
 
-    # Trim matrix and right hand side, eliminate j-th column
-    A = np.delete(A[:next_constraint,:], j, axis=1)
-    b = b[:next_constraint]
     variables = polyhedron.variables
     if variables is not None:
         variables = variables[:j] + variables[j+1:]
@@ -343,17 +348,20 @@ def generate_loop_bounds(iteration_space, iteration_order):
     variables += iteration_space.variables[len(iteration_order):]
     A = np.zeros([constraint_count, len(variables)], dtype=np.dtype(int))
     b = np.zeros([constraint_count], dtype=np.dtype(int))
+    variable_index = {v.name.lower(): i for i, v in enumerate(variables)}
     next_constraint = 0
     for new_idx, var_idx in enumerate(iteration_order):
         # TODO: skip lower/upper bounds already fulfilled
         for bound in lower_bounds[var_idx]:
-            lhs, rhs = Polyhedron.generate_entries_for_lower_bound(bound, variables, new_idx)
-            A[next_constraint,:] = lhs
-            b[next_constraint] = rhs
+            _, b[next_constraint] = Polyhedron.generate_entries_for_lower_bound(
+                bound, variable_index, new_idx, out=A[next_constraint]
+            )
             next_constraint += 1
         for bound in upper_bounds[var_idx]:
-            lhs, rhs = Polyhedron.generate_entries_for_lower_bound(bound, variables, new_idx)
-            A[next_constraint,:] = -lhs
+            _, rhs = Polyhedron.generate_entries_for_lower_bound(
+                bound, variable_index, new_idx, out=A[next_constraint]
+            )
+            A[next_constraint] *= -1
             b[next_constraint] = -rhs
             next_constraint += 1
     A = A[:next_constraint,:]
@@ -374,11 +382,14 @@ def get_nested_loops(loop, depth):
     return as_tuple(loops)
 
 
+_get_loop_components = op.attrgetter('variable', 'bounds', 'body')
+
+
 def get_loop_components(loops):
     """
     Helper routine to extract loop variables, ranges and bodies of list of loops.
     """
-    loop_variables, loop_ranges, loop_bodies = zip(*[(loop.variable, loop.bounds, loop.body) for loop in loops])
+    loop_variables, loop_ranges, loop_bodies = zip(*map(_get_loop_components, loops))
     return (as_tuple(loop_variables), as_tuple(loop_ranges), as_tuple(loop_bodies))
 
 
@@ -409,19 +420,25 @@ def loop_interchange(routine, project_bounds=False):
             loop_variables, loop_ranges, *_ = get_loop_components(loops)
 
             # Find the loop order from the variable order
-            if var_order is None:
-                var_order = [str(var).lower() for var in reversed(loop_variables)]
             loop_variable_names = [var.name.lower() for var in loop_variables]
-            loop_order = [loop_variable_names.index(var) for var in var_order]
+            if var_order is None:
+                var_order = loop_variable_names[::-1]
+            loop_variable_index = {name: idx for idx, name in enumerate(loop_variable_names)}
+            loop_order = [loop_variable_index[var] for var in var_order]
 
             # Project iteration space
             if project_bounds:
                 iteration_space = Polyhedron.from_loop_ranges(loop_variables, loop_ranges)
                 iteration_space = generate_loop_bounds(iteration_space, loop_order)
 
-            # Rebuild loops starting with innermost
-            inner_loop_map = None
-            for idx, (loop, loop_idx) in enumerate(zip(reversed(loops), reversed(loop_order))):
+            # Rebuild loops starting with innermost, unless the loop order is unchanged
+            # and there are no new bounds to apply
+            inner_loop, outer_loop = None, loops[0]
+            if project_bounds or loop_order != list(range(len(loops))):
+                rebuild_loops = zip(reversed(loops), reversed(loop_order))
+            else:
+                rebuild_loops = ()
+            for idx, (loop, loop_idx) in enumerate(rebuild_loops):
                 if project_bounds:
                     new_idx = len(loop_order) - idx - 1
                     ignore_variables = list(range(new_idx+1, len(loop_order)))
@@ -444,10 +461,13 @@ def loop_interchange(routine, project_bounds=False):
                 else:
                     bounds = loop_ranges[loop_idx]
 
-                outer_loop = loop.clone(variable=loop_variables[loop_idx], bounds=bounds)
-                if inner_loop_map is not None:
-                    outer_loop = Transformer(inner_loop_map).visit(outer_loop)
-                inner_loop_map = {loop: outer_loop}
+                # The inner loop is a direct child of the loop body (see get_nested_loops),
+                # thus we can substitute the rebuilt inner loop without a full traversal
+                body = loop.body
+                if inner_loop is not None:
+                    body = tuple(outer_loop if node is inner_loop else node for node in body)
+                inner_loop = loop
+                outer_loop = loop.clone(variable=loop_variables[loop_idx], bounds=bounds, body=body)
 
             # Annotate loop-interchange in a comment
             old_vars = ', '.join(loop_variable_names)
@@ -480,6 +500,51 @@ def pragma_ranges_to_loop_ranges(parameters, scope):
     return as_tuple(ranges)
 
 
+def _bound_difference(bound, other):
+    """
+    Helper routine to compute the difference of two loop bounds, avoiding
+    the call to :any:`simplify` for the common case of integer literals.
+    """
+    if isinstance(bound, sym.IntLiteral) and isinstance(other, sym.IntLiteral):
+        return bound.value - other.value
+    return simplify(bound - other)
+
+
+def _compare_constant(diff, cmp):
+    """
+    Helper routine to compare a bound difference against zero, returning
+    `None` if the difference is not constant.
+    """
+    if isinstance(diff, int):
+        return cmp(diff, 0)
+    if not is_constant(diff):
+        return None
+    return symbolic_op(diff, cmp, 0)
+
+
+def _merge_bound(bounds, bound, cmp):
+    """
+    Helper routine to merge a new bound into a list of lower or upper bounds.
+
+    :data:`cmp` is the comparison that tells whether the new bound extends an existing
+    bound ``b``, evaluated for their difference ``bound - b`` against zero, i.e.,
+    ``operator.lt`` for lower bounds and ``operator.gt`` for upper bounds.
+
+    We learn something new from a bound if
+    (1) we don't have any bounds, yet,
+    (2) bound extends any of the existing bounds, or
+    (3) bound is not constant and not known to lie within any of the existing bounds.
+    In that case, any existing bounds made redundant by it are removed.
+    """
+    # Compare each constant difference only once (None for non-constant differences)
+    is_extending = [_compare_constant(_bound_difference(bound, b), cmp) for b in bounds]
+    is_any_extending = any(e for e in is_extending if e is not None)
+    is_any_not_extending = any(not e for e in is_extending if e is not None)
+    if not bounds or is_any_extending or (not is_constant(bound) and not is_any_not_extending):
+        return [b for b, e in zip(bounds, is_extending) if not e] + [bound]
+    return bounds
+
+
 def loop_fusion(routine):
     """
     Search for loops annotated with the `loki loop-fusion` pragma and attempt
@@ -520,11 +585,14 @@ def loop_fusion(routine):
             fusion_ranges = range_set.pop()
 
         # Next, extract loop ranges for all loops in group and convert to iteration space
-        # polyhedrons for easier alignment
+        # polyhedrons for easier alignment (which also validates the loop ranges), building
+        # only one polyhedron for loop nests with identical variables and ranges
         loop_variables, loop_ranges, loop_bodies = \
                 zip(*[get_loop_components(get_nested_loops(loop, collapse)) for loop in loop_list])
-        iteration_spaces = [Polyhedron.from_loop_ranges(variables, ranges)
-                            for variables, ranges in zip(loop_variables, loop_ranges)]
+        iteration_spaces = {}
+        for variables, ranges in zip(loop_variables, loop_ranges):
+            if (variables, ranges) not in iteration_spaces:
+                iteration_spaces[(variables, ranges)] = Polyhedron.from_loop_ranges(variables, ranges)
 
         # Find the fused iteration space (if not given by a pragma)
         if fusion_ranges is None:
@@ -533,38 +601,11 @@ def loop_fusion(routine):
                 lower_bounds, upper_bounds = [], []
                 ignored_variables = list(range(level+1, collapse))
 
-                for p in iteration_spaces:
+                for p in iteration_spaces.values():
                     for bound in p.lower_bounds(level, ignored_variables):
-                        # Decide if we learn something new from this bound, which could be because:
-                        # (1) we don't have any bounds, yet
-                        # (2) bound is smaller than existing lower bounds (i.e. diff < 0)
-                        # (3) bound is not constant and none of the existing bounds are lower (i.e. diff >= 0)
-                        diff = [simplify(bound - b) for b in lower_bounds]
-                        is_any_negative = any(is_constant(d) and symbolic_op(d, op.lt, 0) for d in diff)
-                        is_any_not_negative = any(is_constant(d) and symbolic_op(d, op.ge, 0) for d in diff)
-                        is_new_bound = (not lower_bounds or is_any_negative or
-                                        (not is_constant(bound) and not is_any_not_negative))
-                        if is_new_bound:
-                            # Remove any lower bounds made redundant by bound:
-                            lower_bounds = [b for b, d in zip(lower_bounds, diff)
-                                            if not (is_constant(d) and symbolic_op(d, op.lt, 0))]
-                            lower_bounds += [bound]
-
+                        lower_bounds = _merge_bound(lower_bounds, bound, op.lt)
                     for bound in p.upper_bounds(level, ignored_variables):
-                        # Decide if we learn something new from this bound, which could be because:
-                        # (1) we don't have any bounds, yet
-                        # (2) bound is larger than existing upper bounds (i.e. diff > 0)
-                        # (3) bound is not constant and none of the existing bounds are larger (i.e. diff <= 0)
-                        diff = [simplify(bound - b) for b in upper_bounds]
-                        is_any_positive = any(is_constant(d) and symbolic_op(d, op.gt, 0) for d in diff)
-                        is_any_not_positive = any(is_constant(d) and symbolic_op(d, op.le, 0) for d in diff)
-                        is_new_bound = (not upper_bounds or is_any_positive or
-                                        (not is_constant(bound) and not is_any_not_positive))
-                        if is_new_bound:
-                            # Remove any lower bounds made redundant by bound:
-                            upper_bounds = [b for b, d in zip(upper_bounds, diff)
-                                            if not (is_constant(d) and symbolic_op(d, op.gt, 0))]
-                            upper_bounds += [bound]
+                        upper_bounds = _merge_bound(upper_bounds, bound, op.gt)
 
                 if len(lower_bounds) == 1:
                     lower_bounds = lower_bounds[0]
@@ -583,21 +624,21 @@ def loop_fusion(routine):
         # Align loop ranges and collect bodies
         fusion_bodies = []
         fusion_variables = loop_variables[0]
-        for idx, (variables, ranges, bodies, p) in enumerate(
-                zip(loop_variables, loop_ranges, loop_bodies, iteration_spaces)):
+        for idx, (variables, ranges, bodies) in enumerate(zip(loop_variables, loop_ranges, loop_bodies)):
             # TODO: This throws away anything that is not in the inner-most loop body.
             body = flatten([Comment(f'! Loki loop-fusion - body {idx} begin'),
                             bodies[-1],
                             Comment(f'! Loki loop-fusion - body {idx} end')])
 
-            # Replace loop variables if necessary
-            var_map = {}
-            for loop_variable, fusion_variable in zip(variables, fusion_variables):
-                if loop_variable != fusion_variable:
-                    var_map.update({var: fusion_variable for var in FindVariables().visit(body)
-                                    if var.name.lower() == loop_variable.name})
-            if var_map:
-                body = SubstituteExpressions(var_map).visit(body)
+            # Replace loop variables if necessary, collecting the body's variables only once
+            renamed_variables = {loop_variable.name: fusion_variable
+                                 for loop_variable, fusion_variable in zip(variables, fusion_variables)
+                                 if loop_variable != fusion_variable}
+            if renamed_variables:
+                var_map = {var: renamed_variables[var.name.lower()] for var in FindVariables().visit(body)
+                           if var.name.lower() in renamed_variables}
+                if var_map:
+                    body = SubstituteExpressions(var_map).visit(body)
 
             # Wrap in conditional if loop bounds are different
             conditions = []
@@ -657,8 +698,12 @@ class FissionTransformer(NestedMaskedTransformer):
         self.loop_pragmas = loop_pragmas
         self.split_loops = {}
 
+        # Look up loops by identity to avoid hashing (and comparing) entire loop nests
+        self._pragmas_by_loop_id = {id(loop): pragmas for loop, pragmas in loop_pragmas.items()}
+
     def visit_Loop(self, o, **kwargs):
-        if o not in self.loop_pragmas:
+        pragmas = self._pragmas_by_loop_id.get(id(o))
+        if pragmas is None:
             # loops that are not marked for fission can be handled as
             # in the regular NestedMaskedTransformer
             return super().visit_InternalNode(o, **kwargs)
@@ -701,14 +746,14 @@ class FissionTransformer(NestedMaskedTransformer):
             return comment + [self._rebuild(o, visited[:body_index] + (body,) + visited[body_index:])]
 
         # Use masked transformer to build subtrees from/to pragma
-        rebuilt = rebuild_fission_branch(None, self.loop_pragmas[o][0], **kwargs)
-        for start, stop in zip(self.loop_pragmas[o][:-1], self.loop_pragmas[o][1:]):
+        rebuilt = rebuild_fission_branch(None, pragmas[0], **kwargs)
+        for start, stop in zip(pragmas[:-1], pragmas[1:]):
             rebuilt += rebuild_fission_branch(start, stop, **kwargs)
-        rebuilt += rebuild_fission_branch(self.loop_pragmas[o][-1], None, **kwargs)
+        rebuilt += rebuild_fission_branch(pragmas[-1], None, **kwargs)
 
         # Register the new loops in the mapping
         loops = [l for l in rebuilt if isinstance(l, Loop)]
-        self.split_loops.update({pragma: loops[i:] for i, pragma in enumerate(self.loop_pragmas[o])})
+        self.split_loops.update({pragma: loops[i:] for i, pragma in enumerate(pragmas)})
 
         # Restore original state (except for the active status because this has potentially
         # been changed when traversing the loop body)
@@ -750,19 +795,22 @@ def loop_fission(routine, promote=True, warn_loop_carries=True):
     loop_carried_vars = {}  # List of loop carried dependencies in original loop
 
     # First, find the loops enclosing each pragma
-    for loop in FindNodes(Loop).visit(routine.body):
-        for pragma in FindNodes(Pragma).visit(loop.body):
-            if is_loki_pragma(pragma, starts_with='loop-fission'):
-                pragma_loops[pragma] += [loop]
+    for pragma in FindNodes(Pragma).visit(routine.body):
+        if is_loki_pragma(pragma, starts_with='loop-fission'):
+            for ancestors in FindScopes(pragma).visit(routine.body):
+                loops = [node for node in ancestors if isinstance(node, Loop)]
+                if loops:
+                    pragma_loops[pragma] += loops
 
     if not pragma_loops:
         return
 
     with optional(promote or warn_loop_carries, dataflow_analysis_attached, routine):
         for pragma in pragma_loops:
-            # Now, sort the loops enclosing each pragma from outside to inside and
-            # keep only the ones relevant for fission
-            loops = binary_insertion_sort(pragma_loops[pragma], lt=is_parent_of)
+            # Keep only the loops relevant for fission. These are already sorted
+            # from outside to inside, since the loops have been collected in a
+            # pre-order traversal of the IR
+            loops = pragma_loops[pragma]
             collapse = int(get_pragma_parameters(pragma).get('collapse', 1))
             pragma_loops[pragma] = loops[-collapse:]
 
@@ -789,8 +837,8 @@ def loop_fission(routine, promote=True, warn_loop_carries=True):
     routine.body = fission_trafo.visit(routine.body)
     info('%s: split %d loop(s) at %d loop-fission pragma(s).', routine.name, len(loop_pragmas), len(pragma_loops))
 
-    # Warn about broken loop-carried dependencies
-    if warn_loop_carries:
+    # Warn about broken loop-carried dependencies (skipping the dataflow analysis if there are none)
+    if warn_loop_carries and any(loop_carried_vars.values()):
         with dataflow_analysis_attached(routine):
             for pragma, loop_carries in loop_carried_vars.items():
                 loop, *remainder = fission_trafo.split_loops[pragma]
@@ -10,6 +10,7 @@ Visitor classes that allow searching the IR
 """
 from itertools import groupby
 
+from loki.ir import Node
 from loki.visitors.visitor import Visitor
 from loki.tools import flatten
 
@@ -63,18 +64,43 @@ class FindNodes(Visitor):
         self.match = match
         self.rule = self.rules[mode]
         self.greedy = greedy
+        if mode == 'type':
+            self._type_matches = {}
+            self.rule = self._match_type
+
+    def _match_type(self, match, o):
+        """
+        Match rule for :data:`mode` ``'type'`` that caches the outcome of the
+        type check per class of :data:`o`, replacing repeated calls to
+        :any:`isinstance` by a dict lookup.
+        """
+        cls = o.__class__
+        try:
+            return self._type_matches[cls]
+        except KeyError:
+            is_match = isinstance(o, match)
+            self._type_matches[cls] = is_match
+            return is_match
 
     def visit_object(self, o, **kwargs):
         ret = kwargs.get('ret')
         return ret or self.default_retval()
 
+    _traversable_types = (Node, tuple, list)
+    """
+    Types of children that are dispatched to a handler. Anything else (e.g.,
+    expressions) cannot contain IR nodes and is skipped without the overhead
+    of a :meth:`visit` call.
+    """
+
     def visit_tuple(self, o, **kwargs):
         """
         Visit all elements in the iterable and return the combined result.
         """
         ret = kwargs.pop('ret', self.default_retval())
         for i in o:
-            ret = self.visit(i, ret=ret, **kwargs)
+            if isinstance(i, self._traversable_types):
+                ret = self.visit(i, ret=ret, **kwargs)
         return ret or self.default_retval()
 
     visit_list = visit_tuple
@@ -90,7 +116,8 @@ class FindNodes(Visitor):
             if self.greedy:
                 return ret
         for i in o.children:
-            ret = self.visit(i, ret=ret, **kwargs)
+            if isinstance(i, self._traversable_types):
+                ret = self.visit(i, ret=ret, **kwargs)
         return ret or self.default_retval()
 
     def visit_TypeDef(self, o, **kwargs):
@@ -169,7 +196,8 @@ class FindScopes(FindNodes):
                 return ret
 
         for i in o.children:
-            ret = self.visit(i, ret=ret, ancestors=ancestors, **kwargs)
+            if isinstance(i, self._traversable_types):
+                ret = self.visit(i, ret=ret, ancestors=ancestors, **kwargs)
         return ret or self.default_retval()
 
 
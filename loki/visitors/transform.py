@@ -173,7 +173,7 @@ class Transformer(Visitor):
         It replaces :data:`o` by :data:`mapper[o]`, if it is in the mapper,
         otherwise visits all children before rebuilding the node.
         """
-        if o in self.mapper:
+        if self.mapper and o in self.mapper:
             handle = self.mapper[o]
             if handle is None:
                 # None -> drop /o/
@@ -201,7 +201,7 @@ class Transformer(Visitor):
         Additionally, it passes down the currently active scope in :attr:`kwargs`
         when recursing to children.
         """
-        if o in self.mapper:
+        if self.mapper and o in self.mapper:
             handle = self.mapper[o]
             if handle is None:
                 # None -> drop /o/
@@ -40,12 +40,36 @@ class GenericVisitor:
             pass
     """
 
+    _handler_names = {}
+    """
+    Cache of handler names per visitor class, mapping the visitee's class name
+    to the name of the corresponding ``visit_Foo`` method. This is populated
+    the first time a visitor class is instantiated, as the method signatures
+    do not change at runtime.
+    """
+
     def __init__(self):
-        handlers = {}
+        cls = type(self)
+        handler_names = GenericVisitor._handler_names.get(cls)
+        if handler_names is None:
+            handler_names = self._find_handler_names()
+            GenericVisitor._handler_names[cls] = handler_names
+        self._handlers = {name: getattr(self, meth_name) for name, meth_name in handler_names.items()}
+        self._dispatch = {}
+
+    def _find_handler_names(self):
+        """
+        Inspect the methods on this instance to find out which handlers
+        are defined.
+
+        Returns
+        -------
+        dict
+            Mapping of class names to the name of the handler method.
+        """
+        handler_names = {}
         # visit methods are spelt visit_Foo.
         prefix = "visit_"
-        # Inspect the methods on this instance to find out which
-        # handlers are defined.
         for (name, meth) in inspect.getmembers(self, predicate=inspect.ismethod):
             if not name.startswith(prefix):
                 continue
@@ -56,8 +80,8 @@ class GenericVisitor:
             if len(argspec.args) < 2:
                 raise RuntimeError("Visit method signature must be "
                                    "visit_Foo(self, o, [*args, **kwargs])")
-            handlers[name[len(prefix):]] = meth
-        self._handlers = handlers
+            handler_names[name[len(prefix):]] = name
+        return handler_names
 
     default_args = {}
     """
@@ -94,9 +118,14 @@ class GenericVisitor:
         :param instance: The instance to look up a method for.
         """
         cls = instance.__class__
+        try:
+            # Have we dispatched on this type before
+            return self._dispatch[cls]
+        except KeyError:
+            pass
         try:
             # Do we have a method handler defined for this type name
-            return self._handlers[cls.__name__]
+            entry = self._handlers[cls.__name__]
         except KeyError:
             # No, walk the MRO.
             for klass in cls.mro()[1:]:
@@ -104,8 +133,12 @@ class GenericVisitor:
                 if entry:
                     # Save it on this type name for faster lookup next time
                     self._handlers[cls.__name__] = entry
-                    return entry
-        raise RuntimeError(f'No handler found for class {cls.__name__}')
+                    break
+            else:
+                raise RuntimeError(f'No handler found for class {cls.__name__}')  # pylint: disable=raise-missing-from
+        # Save it on this type for direct lookup next time
+        self._dispatch[cls] = entry
+        return entry
 
     def visit(self, o, *args, **kwargs):
         """
@@ -0,0 +1,12 @@
+! Module kind_parameters_mod defined in file /root/package/tests/kind_parameters_mod.f90
+
+subroutine f90wrap_kind_parameters_mod__get__jprb(f90wrap_jprb)
+    use kind_parameters_mod, only: kind_parameters_mod_jprb => jprb
+    implicit none
+    integer, intent(out) :: f90wrap_jprb
+    
+    f90wrap_jprb = kind_parameters_mod_jprb
+end subroutine f90wrap_kind_parameters_mod__get__jprb
+
+! End of module kind_parameters_mod defined in file /root/package/tests/kind_parameters_mod.f90
+
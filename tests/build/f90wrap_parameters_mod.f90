@@ -0,0 +1,27 @@
+! Module parameters_mod defined in file /root/package/tests/parameters_mod.f90
+
+subroutine f90wrap_parameters_mod__dummy
+    use parameters_mod
+    implicit none
+    
+    call dummy()
+end subroutine f90wrap_parameters_mod__dummy
+
+subroutine f90wrap_parameters_mod__get__a(f90wrap_a)
+    use parameters_mod, only: parameters_mod_a => a
+    implicit none
+    integer, intent(out) :: f90wrap_a
+    
+    f90wrap_a = parameters_mod_a
+end subroutine f90wrap_parameters_mod__get__a
+
+subroutine f90wrap_parameters_mod__get__b(f90wrap_b)
+    use parameters_mod, only: parameters_mod_b => b
+    implicit none
+    integer, intent(out) :: f90wrap_b
+    
+    f90wrap_b = parameters_mod_b
+end subroutine f90wrap_parameters_mod__get__b
+
+! End of module parameters_mod defined in file /root/package/tests/parameters_mod.f90
+
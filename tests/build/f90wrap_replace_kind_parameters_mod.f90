@@ -0,0 +1,12 @@
+! Module replace_kind_parameters_mod defined in file /root/package/tests/replace_kind_parameters_mod.f90
+
+subroutine f90wrap_replace_kind_parameters_mod__get__jprb(f90wrap_jprb)
+    use replace_kind_parameters_mod, only: replace_kind_parameters_mod_jprb => jprb
+    implicit none
+    integer, intent(out) :: f90wrap_jprb
+    
+    f90wrap_jprb = replace_kind_parameters_mod_jprb
+end subroutine f90wrap_replace_kind_parameters_mod__get__jprb
+
+! End of module replace_kind_parameters_mod defined in file /root/package/tests/replace_kind_parameters_mod.f90
+
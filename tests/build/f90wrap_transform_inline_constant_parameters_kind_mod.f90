@@ -0,0 +1,13 @@
+! Module transform_inline_constant_parameters_kind_mod defined in file /root/package/tests/transform_inline_constant_parameters_kind_mod.f90
+
+subroutine f90wrap_transform_inline_constant_parameters_kind_mod__tran9758(v1)
+    use transform_inline_constant_parameters_kind_mod
+    use kind_parameters_mod, only: jprb
+    implicit none
+    
+    real(8), intent(out) :: v1
+    call transform_inline_constant_parameters_kind(v1=v1)
+end subroutine f90wrap_transform_inline_constant_parameters_kind_mod__tran9758
+
+! End of module transform_inline_constant_parameters_kind_mod defined in file /root/package/tests/transform_inline_constant_parameters_kind_mod.f90
+
@@ -0,0 +1,12 @@
+! Module transform_inline_constant_parameters_kind_mod_ defined in file /root/package/tests/transform_inline_constant_parameters_kind_mod_.f90
+
+subroutine f90wrap_transform_inline_constant_parameters_kind_mod___tra1724(v1)
+    use transform_inline_constant_parameters_kind_mod_
+    implicit none
+    
+    real(selected_real_kind(13, 300), intent(out) :: v1
+    call transform_inline_constant_parameters_kind(v1=v1)
+end subroutine f90wrap_transform_inline_constant_parameters_kind_mod___tra1724
+
+! End of module transform_inline_constant_parameters_kind_mod_ defined in file /root/package/tests/transform_inline_constant_parameters_kind_mod_.f90
+
@@ -0,0 +1,22 @@
+! Module transform_inline_constant_parameters_mod defined in file /root/package/tests/transform_inline_constant_parameters_mod.f90
+
+subroutine f90wrap_transform_inline_constant_parameters_mod__transformfd2d(v1, v2, v3)
+    use transform_inline_constant_parameters_mod
+    implicit none
+    
+    integer, intent(in) :: v1
+    integer, intent(out) :: v2
+    integer, intent(out) :: v3
+    call transform_inline_constant_parameters(v1=v1, v2=v2, v3=v3)
+end subroutine f90wrap_transform_inline_constant_parameters_mod__transformfd2d
+
+subroutine f90wrap_transform_inline_constant_parameters_mod__get__c(f90wrap_c)
+    use transform_inline_constant_parameters_mod, only: transform_inline_constant_parameters_mod_c => c
+    implicit none
+    integer, intent(out) :: f90wrap_c
+    
+    f90wrap_c = transform_inline_constant_parameters_mod_c
+end subroutine f90wrap_transform_inline_constant_parameters_mod__get__c
+
+! End of module transform_inline_constant_parameters_mod defined in file /root/package/tests/transform_inline_constant_parameters_mod.f90
+
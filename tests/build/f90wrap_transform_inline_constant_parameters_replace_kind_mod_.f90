@@ -0,0 +1,12 @@
+! Module transform_inline_constant_parameters_replace_kind_mod_ defined in file /root/package/tests/transform_inline_constant_parameters_replace_kind_mod_.f90
+
+subroutine f90wrap_transform_inline_constant_parameters_replace_kind_m3951(v1)
+    use transform_inline_constant_parameters_replace_kind_mod_
+    implicit none
+    
+    real(8), intent(out) :: v1
+    call transform_inline_constant_parameters_replace_kind(v1=v1)
+end subroutine f90wrap_transform_inline_constant_parameters_replace_kind_m3951
+
+! End of module transform_inline_constant_parameters_replace_kind_mod_ defined in file /root/package/tests/transform_inline_constant_parameters_replace_kind_mod_.f90
+
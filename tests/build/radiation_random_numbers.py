@@ -0,0 +1,215 @@
+from __future__ import print_function, absolute_import, division
+import _radiation_random_numbers
+import f90wrap.runtime
+import logging
+import numpy
+import warnings
+import weakref
+
+class Radiation_Random_Numbers(f90wrap.runtime.FortranModule):
+    """
+    Module radiation_random_numbers
+    Defined at /root/package/tests/radiation_random_numbers.F90 lines 1-33
+    """
+    @f90wrap.runtime.register_class("radiation_random_numbers.rng_type")
+    class rng_type(f90wrap.runtime.FortranDerivedType):
+        """
+        Type(name=rng_type)
+        Defined at /root/package/tests/radiation_random_numbers.F90 lines 10-14
+        """
+        def __init__(self, handle=None):
+            """
+            Automatically generated constructor for rng_type
+            
+            self = Rng_Type()
+            Defined at /root/package/tests/radiation_random_numbers.F90 lines 10-14
+            
+            Returns
+            -------
+            this : Rng_Type
+                Object to be constructed
+            
+            """
+            f90wrap.runtime.FortranDerivedType.__init__(self)
+            if isinstance(handle, numpy.ndarray) and handle.ndim == 1 and handle.dtype.num \
+                == 5:
+                self._handle = handle
+                self._alloc = True
+            else:
+                result = \
+                    _radiation_random_numbers.f90wrap_radiation_random_numbers__rng_type_initialise()
+                self._handle = result[0] if isinstance(result, tuple) else result
+                self._alloc = True
+            self._setup_finalizer()
+        
+        def _setup_finalizer(self):
+            """Set up weak reference destructor to prevent Fortran memory leaks."""
+            if self._alloc:
+                destructor = getattr(_radiation_random_numbers, \
+                    "f90wrap_radiation_random_numbers__rng_type_finalise")
+                self._finalizer = weakref.finalize(self, destructor, self._handle)
+        
+        @property
+        def itype(self):
+            """
+            Element itype ftype=integer(kind=jpim) pytype=int32
+            Defined at /root/package/tests/radiation_random_numbers.F90 line 11
+            """
+            return _radiation_random_numbers.f90wrap_rng_type__get__itype(self._handle)
+        
+        @itype.setter
+        def itype(self, itype):
+            _radiation_random_numbers.f90wrap_rng_type__set__itype(self._handle, itype)
+        
+        @property
+        def istate(self):
+            """
+            Element istate ftype=real(kind=jprb) pytype=float array
+            Defined at /root/package/tests/radiation_random_numbers.F90 line 12
+            """
+            array_ndim, array_type, array_shape, array_handle = \
+                _radiation_random_numbers.f90wrap_rng_type__array__istate(self._handle)
+            array_hash = hash((array_ndim, array_type, tuple(array_shape), array_handle))
+            istate = self._arrays.get(array_hash)
+            if istate is not None:
+                # Validate cached array: check data pointer matches current handle (issue #222)
+                # Arrays can be deallocated and reallocated at same address, invalidating cache
+                if istate.ctypes.data != array_handle:
+                    istate = None
+            if istate is None:
+                try:
+                    istate = f90wrap.runtime.get_array(f90wrap.runtime.sizeof_fortran_t,
+                                            self._handle,
+                                            _radiation_random_numbers.f90wrap_rng_type__array__istate)
+                except TypeError:
+                    istate = f90wrap.runtime.direct_c_array(array_type, array_shape, array_handle)
+                self._arrays[array_hash] = istate
+            return istate
+        
+        @istate.setter
+        def istate(self, istate):
+            self.istate[...] = istate
+        
+        @property
+        def nmaxstreams(self):
+            """
+            Element nmaxstreams ftype=integer(kind=jpim) pytype=int32
+            Defined at /root/package/tests/radiation_random_numbers.F90 line 13
+            """
+            return \
+                _radiation_random_numbers.f90wrap_rng_type__get__nmaxstreams(self._handle)
+        
+        @nmaxstreams.setter
+        def nmaxstreams(self, nmaxstreams):
+            _radiation_random_numbers.f90wrap_rng_type__set__nmaxstreams(self._handle, \
+                nmaxstreams)
+        
+        @property
+        def iseed(self):
+            """
+            Element iseed ftype=integer(kind=jpim) pytype=int32
+            Defined at /root/package/tests/radiation_random_numbers.F90 line 14
+            """
+            return _radiation_random_numbers.f90wrap_rng_type__get__iseed(self._handle)
+        
+        @iseed.setter
+        def iseed(self, iseed):
+            _radiation_random_numbers.f90wrap_rng_type__set__iseed(self._handle, iseed)
+        
+        def __str__(self):
+            ret = ['<rng_type>{\n']
+            ret.append('    itype : ')
+            ret.append(repr(self.itype))
+            ret.append(',\n    istate : ')
+            ret.append(repr(self.istate))
+            ret.append(',\n    nmaxstreams : ')
+            ret.append(repr(self.nmaxstreams))
+            ret.append(',\n    iseed : ')
+            ret.append(repr(self.iseed))
+            ret.append('}')
+            return ''.join(ret)
+        
+        _dt_array_initialisers = []
+        
+    
+    @staticmethod
+    def rng_default(interface_call=False):
+        """
+        istate_dim, maxstreams = rng_default()
+        Defined at /root/package/tests/radiation_random_numbers.F90 lines 17-24
+        
+        Returns
+        -------
+        istate_dim : int32
+        maxstreams : int32
+        """
+        istate_dim, maxstreams = \
+            _radiation_random_numbers.f90wrap_radiation_random_numbers__rng_default()
+        return istate_dim, maxstreams
+    
+    @staticmethod
+    def rng_init(interface_call=False):
+        """
+        istate_dim, maxstreams = rng_init()
+        Defined at /root/package/tests/radiation_random_numbers.F90 lines 26-33
+        
+        Returns
+        -------
+        istate_dim : int32
+        maxstreams : int32
+        """
+        istate_dim, maxstreams = \
+            _radiation_random_numbers.f90wrap_radiation_random_numbers__rng_init()
+        return istate_dim, maxstreams
+    
+    @property
+    def jpim(self):
+        """
+        Element jpim ftype=integer pytype=int32
+        Defined at /root/package/tests/radiation_random_numbers.F90 line 7
+        """
+        return _radiation_random_numbers.f90wrap_radiation_random_numbers__get__jpim()
+    
+    def get_jpim(self):
+        return self.jpim
+    
+    @property
+    def jprb(self):
+        """
+        Element jprb ftype=integer pytype=int32
+        Defined at /root/package/tests/radiation_random_numbers.F90 line 8
+        """
+        return _radiation_random_numbers.f90wrap_radiation_random_numbers__get__jprb()
+    
+    def get_jprb(self):
+        return self.jprb
+    
+    @property
+    def nmaxstreams(self):
+        """
+        Element nmaxstreams ftype=integer(kind=jpim) pytype=int32
+        Defined at /root/package/tests/radiation_random_numbers.F90 line 9
+        """
+        return \
+            _radiation_random_numbers.f90wrap_radiation_random_numbers__get__nmaxstreams()
+    
+    def get_nmaxstreams(self):
+        return self.nmaxstreams
+    
+    def __str__(self):
+        ret = ['<radiation_random_numbers>{\n']
+        ret.append('    jpim : ')
+        ret.append(repr(self.jpim))
+        ret.append(',\n    jprb : ')
+        ret.append(repr(self.jprb))
+        ret.append(',\n    nmaxstreams : ')
+        ret.append(repr(self.nmaxstreams))
+        ret.append('}')
+        return ''.join(ret)
+    
+    _dt_array_initialisers = []
+    
+    
+
+radiation_random_numbers = Radiation_Random_Numbers()
+
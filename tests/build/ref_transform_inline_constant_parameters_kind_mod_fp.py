@@ -0,0 +1,65 @@
+from __future__ import print_function, absolute_import, division
+import _ref_transform_inline_constant_parameters_kind_mod_fp
+import f90wrap.runtime
+import logging
+import numpy
+import warnings
+import weakref
+
+class \
+    Transform_Inline_Constant_Parameters_Kind_Mod(f90wrap.runtime.FortranModule):
+    """
+    Module transform_inline_constant_parameters_kind_mod
+    Defined at /root/package/tests/transform_inline_constant_parameters_kind_mod.f90 \
+        lines 1-7
+    """
+    @staticmethod
+    def transform_inline_constant_parameters_kind(interface_call=False):
+        """
+        v1 = transform_inline_constant_parameters_kind()
+        Defined at /root/package/tests/transform_inline_constant_parameters_kind_mod.f90 \
+            lines 4-7
+        
+        Returns
+        -------
+        v1 : float64
+        """
+        v1 = \
+            _ref_transform_inline_constant_parameters_kind_mod_fp.f90wrap_transform_inline_constant_parameters_kind_mod__tran9758()
+        return v1
+    
+    _dt_array_initialisers = []
+    
+
+transform_inline_constant_parameters_kind_mod = \
+    Transform_Inline_Constant_Parameters_Kind_Mod()
+
+class Kind_Parameters_Mod(f90wrap.runtime.FortranModule):
+    """
+    Module kind_parameters_mod
+    Defined at /root/package/tests/kind_parameters_mod.f90 lines 1-2
+    """
+    @property
+    def jprb(self):
+        """
+        Element jprb ftype=integer pytype=int32
+        Defined at /root/package/tests/kind_parameters_mod.f90 line 3
+        """
+        return \
+            _ref_transform_inline_constant_parameters_kind_mod_fp.f90wrap_kind_parameters_mod__get__jprb()
+    
+    def get_jprb(self):
+        return self.jprb
+    
+    def __str__(self):
+        ret = ['<kind_parameters_mod>{\n']
+        ret.append('    jprb : ')
+        ret.append(repr(self.jprb))
+        ret.append('}')
+        return ''.join(ret)
+    
+    _dt_array_initialisers = []
+    
+
+kind_parameters_mod = Kind_Parameters_Mod()
+
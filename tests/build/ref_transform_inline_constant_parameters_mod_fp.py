@@ -0,0 +1,112 @@
+from __future__ import print_function, absolute_import, division
+import _ref_transform_inline_constant_parameters_mod_fp
+import f90wrap.runtime
+import logging
+import numpy
+import warnings
+import weakref
+
+class Transform_Inline_Constant_Parameters_Mod(f90wrap.runtime.FortranModule):
+    """
+    Module transform_inline_constant_parameters_mod
+    Defined at /root/package/tests/transform_inline_constant_parameters_mod.f90 \
+        lines 1-11
+    """
+    @staticmethod
+    def transform_inline_constant_parameters(v1, interface_call=False):
+        """
+        v2, v3 = transform_inline_constant_parameters(v1)
+        Defined at /root/package/tests/transform_inline_constant_parameters_mod.f90 \
+            lines 6-11
+        
+        Parameters
+        ----------
+        v1 : int32
+        
+        Returns
+        -------
+        v2 : int32
+        v3 : int32
+        """
+        v2, v3 = \
+            _ref_transform_inline_constant_parameters_mod_fp.f90wrap_transform_inline_constant_parameters_mod__transformfd2d(v1=v1)
+        return v2, v3
+    
+    @property
+    def c(self):
+        """
+        Element c ftype=integer pytype=int32
+        Defined at /root/package/tests/transform_inline_constant_parameters_mod.f90 line \
+            4
+        """
+        return \
+            _ref_transform_inline_constant_parameters_mod_fp.f90wrap_transform_inline_constant_parameters_mod__get__c()
+    
+    def get_c(self):
+        return self.c
+    
+    def __str__(self):
+        ret = ['<transform_inline_constant_parameters_mod>{\n']
+        ret.append('    c : ')
+        ret.append(repr(self.c))
+        ret.append('}')
+        return ''.join(ret)
+    
+    _dt_array_initialisers = []
+    
+
+transform_inline_constant_parameters_mod = \
+    Transform_Inline_Constant_Parameters_Mod()
+
+class Parameters_Mod(f90wrap.runtime.FortranModule):
+    """
+    Module parameters_mod
+    Defined at /root/package/tests/parameters_mod.f90 lines 1-6
+    """
+    @staticmethod
+    def dummy(interface_call=False):
+        """
+        dummy()
+        Defined at /root/package/tests/parameters_mod.f90 lines 6-6
+        
+        """
+        _ref_transform_inline_constant_parameters_mod_fp.f90wrap_parameters_mod__dummy()
+    
+    @property
+    def a(self):
+        """
+        Element a ftype=integer pytype=int32
+        Defined at /root/package/tests/parameters_mod.f90 line 3
+        """
+        return \
+            _ref_transform_inline_constant_parameters_mod_fp.f90wrap_parameters_mod__get__a()
+    
+    def get_a(self):
+        return self.a
+    
+    @property
+    def b(self):
+        """
+        Element b ftype=integer pytype=int32
+        Defined at /root/package/tests/parameters_mod.f90 line 4
+        """
+        return \
+            _ref_transform_inline_constant_parameters_mod_fp.f90wrap_parameters_mod__get__b()
+    
+    def get_b(self):
+        return self.b
+    
+    def __str__(self):
+        ret = ['<parameters_mod>{\n']
+        ret.append('    a : ')
+        ret.append(repr(self.a))
+        ret.append(',\n    b : ')
+        ret.append(repr(self.b))
+        ret.append('}')
+        return ''.join(ret)
+    
+    _dt_array_initialisers = []
+    
+
+parameters_mod = Parameters_Mod()
+
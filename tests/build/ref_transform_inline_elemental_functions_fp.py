@@ -0,0 +1,57 @@
+from __future__ import print_function, absolute_import, division
+import _ref_transform_inline_elemental_functions_fp
+import f90wrap.runtime
+import logging
+import numpy
+import warnings
+import weakref
+
+class Multiply_Mod(f90wrap.runtime.FortranModule):
+    """
+    Module multiply_mod
+    Defined at /root/package/tests/multiply_mod.f90 lines 1-8
+    """
+    @staticmethod
+    def multiply(a, b, interface_call=False):
+        """
+        multiply = multiply(a, b)
+        Defined at /root/package/tests/multiply_mod.f90 lines 5-8
+        
+        Parameters
+        ----------
+        a : float64
+        b : float64
+        
+        Returns
+        -------
+        multiply : float64
+        """
+        multiply = \
+            _ref_transform_inline_elemental_functions_fp.f90wrap_multiply_mod__multiply(a=a, \
+            b=b)
+        return multiply
+    
+    _dt_array_initialisers = []
+    
+
+multiply_mod = Multiply_Mod()
+
+def transform_inline_elemental_functions(v1, interface_call=False):
+    """
+    v2, v3 = transform_inline_elemental_functions(v1)
+    Defined at /root/package/tests/transform_inline_elemental_functions.f90 lines \
+        1-6
+    
+    Parameters
+    ----------
+    v1 : float64
+    
+    Returns
+    -------
+    v2 : float64
+    v3 : float64
+    """
+    v2, v3 = \
+        _ref_transform_inline_elemental_functions_fp.f90wrap_transform_inline_elemental_functions(v1=v1)
+    return v2, v3
+
@@ -0,0 +1,60 @@
+from __future__ import print_function, absolute_import, division
+import _transform_inline_constant_parameters_mod__fp
+import f90wrap.runtime
+import logging
+import numpy
+import warnings
+import weakref
+
+class Transform_Inline_Constant_Parameters_Mod_(f90wrap.runtime.FortranModule):
+    """
+    Module transform_inline_constant_parameters_mod_
+    Defined at /root/package/tests/transform_inline_constant_parameters_mod_.f90 \
+        lines 1-11
+    """
+    @staticmethod
+    def transform_inline_constant_parameters(v1, interface_call=False):
+        """
+        v2, v3 = transform_inline_constant_parameters(v1)
+        Defined at /root/package/tests/transform_inline_constant_parameters_mod_.f90 \
+            lines 6-11
+        
+        Parameters
+        ----------
+        v1 : int32
+        
+        Returns
+        -------
+        v2 : int32
+        v3 : int32
+        """
+        v2, v3 = \
+            _transform_inline_constant_parameters_mod__fp.f90wrap_transform_inline_constant_parameters_mod___transfor6ab5(v1=v1)
+        return v2, v3
+    
+    @property
+    def c(self):
+        """
+        Element c ftype=integer pytype=int32
+        Defined at /root/package/tests/transform_inline_constant_parameters_mod_.f90 \
+            line 4
+        """
+        return \
+            _transform_inline_constant_parameters_mod__fp.f90wrap_transform_inline_constant_parameters_mod___get__c()
+    
+    def get_c(self):
+        return self.c
+    
+    def __str__(self):
+        ret = ['<transform_inline_constant_parameters_mod_>{\n']
+        ret.append('    c : ')
+        ret.append(repr(self.c))
+        ret.append('}')
+        return ''.join(ret)
+    
+    _dt_array_initialisers = []
+    
+
+transform_inline_constant_parameters_mod_ = \
+    Transform_Inline_Constant_Parameters_Mod_()
+
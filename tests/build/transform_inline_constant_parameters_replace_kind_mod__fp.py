@@ -0,0 +1,38 @@
+from __future__ import print_function, absolute_import, division
+import _transform_inline_constant_parameters_replace_kind_mod__fp
+import f90wrap.runtime
+import logging
+import numpy
+import warnings
+import weakref
+
+class \
+    Transform_Inline_Constant_Parameters_Replace_Kind_Mod_(f90wrap.runtime.FortranModule):
+    """
+    Module transform_inline_constant_parameters_replace_kind_mod_
+    Defined at \
+        /root/package/tests/transform_inline_constant_parameters_replace_kind_mod_.f90 \
+        lines 1-9
+    """
+    @staticmethod
+    def transform_inline_constant_parameters_replace_kind(interface_call=False):
+        """
+        v1 = transform_inline_constant_parameters_replace_kind()
+        Defined at \
+            /root/package/tests/transform_inline_constant_parameters_replace_kind_mod_.f90 \
+            lines 4-9
+        
+        Returns
+        -------
+        v1 : float64
+        """
+        v1 = \
+            _transform_inline_constant_parameters_replace_kind_mod__fp.f90wrap_transform_inline_constant_parameters_replace_kind_m3951()
+        return v1
+    
+    _dt_array_initialisers = []
+    
+
+transform_inline_constant_parameters_replace_kind_mod_ = \
+    Transform_Inline_Constant_Parameters_Replace_Kind_Mod_()
+
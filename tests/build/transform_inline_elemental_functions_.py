@@ -0,0 +1,27 @@
+from __future__ import print_function, absolute_import, division
+import _transform_inline_elemental_functions_
+import f90wrap.runtime
+import logging
+import numpy
+import warnings
+import weakref
+
+def transform_inline_elemental_functions_(v1, interface_call=False):
+    """
+    v2, v3 = transform_inline_elemental_functions_(v1)
+    Defined at /root/package/tests/transform_inline_elemental_functions_.f90 lines \
+        1-5
+    
+    Parameters
+    ----------
+    v1 : float64
+    
+    Returns
+    -------
+    v2 : float64
+    v3 : float64
+    """
+    v2, v3 = \
+        _transform_inline_elemental_functions_.f90wrap_transform_inline_elemental_functions_(v1=v1)
+    return v2, v3
+
@@ -16,7 +16,7 @@ from loki import (
     as_tuple, Frontend, Section, REGEX
 )
 from loki.build import Builder, Lib, Obj
-from loki.tools import gettempdir, filehash
+from loki.tools import gettempdir, filehash, cached_func
 import loki.frontend
 
 
@@ -286,11 +286,15 @@ def available_frontends(xfail=None, skip=None, include_regex=False):
     return params
 
 
+@cached_func
 def graphviz_present():
     """
     Test if graphviz is present and works
     The import will work as long as the graphviz python wrapper is available,
     but the underlying binaries may be missing.
+
+    The result is cached, since the check invokes the Graphviz binaries and
+    is evaluated by every decorated test at collection time.
     """
     try:
         import graphviz as gviz # pylint: disable=import-outside-toplevel
@@ -0,0 +1,185 @@
+! Module radiation_random_numbers defined in file /root/package/tests/radiation_random_numbers_fp.F90
+
+subroutine f90wrap_rng_type__get__itype(this, f90wrap_itype)
+    use radiation_random_numbers
+    use, intrinsic :: iso_c_binding, only: c_int
+    implicit none
+    type rng_type_ptr_type
+        type(rng_type), pointer :: p => NULL()
+    end type rng_type_ptr_type
+    integer(c_int), intent(in)   :: this(4)
+    type(rng_type_ptr_type) :: this_ptr
+    integer(4), intent(out) :: f90wrap_itype
+    
+    this_ptr = transfer(this, this_ptr)
+    f90wrap_itype = this_ptr%p%itype
+end subroutine f90wrap_rng_type__get__itype
+
+subroutine f90wrap_rng_type__set__itype(this, f90wrap_itype)
+    use radiation_random_numbers
+    use, intrinsic :: iso_c_binding, only: c_int
+    implicit none
+    type rng_type_ptr_type
+        type(rng_type), pointer :: p => NULL()
+    end type rng_type_ptr_type
+    integer(c_int), intent(in)   :: this(4)
+    type(rng_type_ptr_type) :: this_ptr
+    integer(4), intent(in) :: f90wrap_itype
+    
+    this_ptr = transfer(this, this_ptr)
+    this_ptr%p%itype = f90wrap_itype
+end subroutine f90wrap_rng_type__set__itype
+
+subroutine f90wrap_rng_type__array__istate(this, nd, dtype, dshape, dloc)
+    use radiation_random_numbers
+    use, intrinsic :: iso_c_binding, only : c_int
+    implicit none
+    type rng_type_ptr_type
+        type(rng_type), pointer :: p => NULL()
+    end type rng_type_ptr_type
+    integer(c_int), intent(in) :: this(4)
+    type(rng_type_ptr_type) :: this_ptr
+    integer(c_int), intent(out) :: nd
+    integer(c_int), intent(out) :: dtype
+    integer(c_int), dimension(10), intent(out) :: dshape
+    integer*8, intent(out) :: dloc
+    
+    nd = 1
+    dtype = 12
+    this_ptr = transfer(this, this_ptr)
+    dshape(1:1) = shape(this_ptr%p%istate)
+    dloc = loc(this_ptr%p%istate)
+end subroutine f90wrap_rng_type__array__istate
+
+subroutine f90wrap_rng_type__get__nmaxstreams(this, f90wrap_nmaxstreams)
+    use radiation_random_numbers
+    use, intrinsic :: iso_c_binding, only: c_int
+    implicit none
+    type rng_type_ptr_type
+        type(rng_type), pointer :: p => NULL()
+    end type rng_type_ptr_type
+    integer(c_int), intent(in)   :: this(4)
+    type(rng_type_ptr_type) :: this_ptr
+    integer(4), intent(out) :: f90wrap_nmaxstreams
+    
+    this_ptr = transfer(this, this_ptr)
+    f90wrap_nmaxstreams = this_ptr%p%nmaxstreams
+end subroutine f90wrap_rng_type__get__nmaxstreams
+
+subroutine f90wrap_rng_type__set__nmaxstreams(this, f90wrap_nmaxstreams)
+    use radiation_random_numbers
+    use, intrinsic :: iso_c_binding, only: c_int
+    implicit none
+    type rng_type_ptr_type
+        type(rng_type), pointer :: p => NULL()
+    end type rng_type_ptr_type
+    integer(c_int), intent(in)   :: this(4)
+    type(rng_type_ptr_type) :: this_ptr
+    integer(4), intent(in) :: f90wrap_nmaxstreams
+    
+    this_ptr = transfer(this, this_ptr)
+    this_ptr%p%nmaxstreams = f90wrap_nmaxstreams
+end subroutine f90wrap_rng_type__set__nmaxstreams
+
+subroutine f90wrap_rng_type__get__iseed(this, f90wrap_iseed)
+    use radiation_random_numbers
+    use, intrinsic :: iso_c_binding, only: c_int
+    implicit none
+    type rng_type_ptr_type
+        type(rng_type), pointer :: p => NULL()
+    end type rng_type_ptr_type
+    integer(c_int), intent(in)   :: this(4)
+    type(rng_type_ptr_type) :: this_ptr
+    integer(4), intent(out) :: f90wrap_iseed
+    
+    this_ptr = transfer(this, this_ptr)
+    f90wrap_iseed = this_ptr%p%iseed
+end subroutine f90wrap_rng_type__get__iseed
+
+subroutine f90wrap_rng_type__set__iseed(this, f90wrap_iseed)
+    use radiation_random_numbers
+    use, intrinsic :: iso_c_binding, only: c_int
+    implicit none
+    type rng_type_ptr_type
+        type(rng_type), pointer :: p => NULL()
+    end type rng_type_ptr_type
+    integer(c_int), intent(in)   :: this(4)
+    type(rng_type_ptr_type) :: this_ptr
+    integer(4), intent(in) :: f90wrap_iseed
+    
+    this_ptr = transfer(this, this_ptr)
+    this_ptr%p%iseed = f90wrap_iseed
+end subroutine f90wrap_rng_type__set__iseed
+
+subroutine f90wrap_radiation_random_numbers__rng_type_initialise(this)
+    use radiation_random_numbers
+    use, intrinsic :: iso_c_binding, only: c_int
+    implicit none
+    
+    type rng_type_ptr_type
+        type(rng_type), pointer :: p => NULL()
+    end type rng_type_ptr_type
+    type(rng_type_ptr_type) :: this_ptr
+    integer(c_int), intent(out), dimension(4) :: this
+    allocate(this_ptr%p)
+    this = transfer(this_ptr, this)
+end subroutine f90wrap_radiation_random_numbers__rng_type_initialise
+
+subroutine f90wrap_radiation_random_numbers__rng_type_finalise(this)
+    use radiation_random_numbers
+    use, intrinsic :: iso_c_binding, only: c_int
+    implicit none
+    
+    type rng_type_ptr_type
+        type(rng_type), pointer :: p => NULL()
+    end type rng_type_ptr_type
+    type(rng_type_ptr_type) :: this_ptr
+    integer(c_int), intent(in), dimension(4) :: this
+    this_ptr = transfer(this, this_ptr)
+    deallocate(this_ptr%p)
+end subroutine f90wrap_radiation_random_numbers__rng_type_finalise
+
+subroutine f90wrap_radiation_random_numbers__rng_default(istate_dim, maxstreams)
+    use radiation_random_numbers
+    implicit none
+    
+    integer, intent(out) :: istate_dim
+    integer, intent(out) :: maxstreams
+    call rng_default(istate_dim=istate_dim, maxstreams=maxstreams)
+end subroutine f90wrap_radiation_random_numbers__rng_default
+
+subroutine f90wrap_radiation_random_numbers__rng_init(istate_dim, maxstreams)
+    use radiation_random_numbers
+    implicit none
+    
+    integer, intent(out) :: istate_dim
+    integer, intent(out) :: maxstreams
+    call rng_init(istate_dim=istate_dim, maxstreams=maxstreams)
+end subroutine f90wrap_radiation_random_numbers__rng_init
+
+subroutine f90wrap_radiation_random_numbers__get__jpim(f90wrap_jpim)
+    use radiation_random_numbers, only: radiation_random_numbers_jpim => jpim
+    implicit none
+    integer, intent(out) :: f90wrap_jpim
+    
+    f90wrap_jpim = radiation_random_numbers_jpim
+end subroutine f90wrap_radiation_random_numbers__get__jpim
+
+subroutine f90wrap_radiation_random_numbers__get__jprb(f90wrap_jprb)
+    use radiation_random_numbers, only: radiation_random_numbers_jprb => jprb
+    implicit none
+    integer, intent(out) :: f90wrap_jprb
+    
+    f90wrap_jprb = radiation_random_numbers_jprb
+end subroutine f90wrap_radiation_random_numbers__get__jprb
+
+subroutine f90wrap_radiation_random_numbers__get__nmaxstreams(f90wrap_NMaxStreams)
+    use radiation_random_numbers, only: radiation_random_numbers_NMaxStreams => NMaxStreams
+    implicit none
+    integer(4), intent(out) :: f90wrap_NMaxStreams
+    
+    f90wrap_NMaxStreams = radiation_random_numbers_NMaxStreams
+end subroutine f90wrap_radiation_random_numbers__get__nmaxstreams
+
+! End of module radiation_random_numbers defined in file /root/package/tests/radiation_random_numbers_fp.F90
+
@@ -0,0 +1,9 @@
+subroutine f90wrap_member_routines(a, b)
+    implicit none
+    external member_routines
+    
+    real(8), intent(inout), dimension(3) :: a
+    real(8), intent(inout), dimension(3) :: b
+    call member_routines(a, b)
+end subroutine f90wrap_member_routines
+
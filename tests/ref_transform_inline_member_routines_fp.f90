@@ -0,0 +1,31 @@
+SUBROUTINE member_routines (a, b)
+  REAL(KIND=8), INTENT(INOUT) :: a(3), b(3)
+  INTEGER :: i
+  
+  DO i=1,SIZE(a)
+    CALL add_one(a(i))
+  END DO
+  
+  CALL add_to_a(b)
+  
+  DO i=1,SIZE(a)
+    CALL add_one(a(i))
+  END DO
+  
+  CONTAINS
+  
+  SUBROUTINE add_one (a)
+    REAL(KIND=8), INTENT(INOUT) :: a
+    a = a + 1
+  END SUBROUTINE add_one
+  
+  SUBROUTINE add_to_a (b)
+    REAL(KIND=8), INTENT(INOUT) :: b(:)
+    INTEGER :: n
+    
+    n = SIZE(a)
+    DO i=1,n
+      a(i) = a(i) + b(i)
+    END DO
+  END SUBROUTINE add_to_a
+END SUBROUTINE member_routines
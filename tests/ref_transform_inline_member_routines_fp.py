@@ -0,0 +1,21 @@
+from __future__ import print_function, absolute_import, division
+import _ref_transform_inline_member_routines_fp
+import f90wrap.runtime
+import logging
+import numpy
+import warnings
+import weakref
+
+def member_routines(a, b, interface_call=False):
+    """
+    member_routines(a, b)
+    Defined at /root/package/tests/ref_transform_inline_member_routines_fp.f90 lines \
+        1-22
+    
+    Parameters
+    ----------
+    a : float array
+    b : float array
+    """
+    _ref_transform_inline_member_routines_fp.f90wrap_member_routines(a=a, b=b)
+
@@ -0,0 +1,74 @@
+from __future__ import print_function, absolute_import, division
+import _subroutine_external
+import f90wrap.runtime
+import logging
+import numpy
+import warnings
+import weakref
+
+def routine_external_stmt(invar, sub1, sub2, sub3, func1, func2, func3, \
+    interface_call=False):
+    """
+    outvar = routine_external_stmt(invar, sub1, sub2, sub3, func1, func2, func3)
+    Defined at /root/package/tests/subroutine_routine_external_stmt_fp.f90 lines \
+        1-17
+    
+    Parameters
+    ----------
+    invar : int32
+    sub1 : float32
+    sub2 : float32
+    sub3 : float32
+    func1 : float32
+    func2 : float32
+    func3 : float32
+    
+    Returns
+    -------
+    outvar : int32
+    """
+    outvar = _subroutine_external.f90wrap_routine_external_stmt(invar=invar, \
+        sub1=sub1, sub2=sub2, sub3=sub3, func1=func1, func2=func2, func3=func3)
+    return outvar
+
+def routine_call_external_stmt(invar, interface_call=False):
+    """
+    outvar = routine_call_external_stmt(invar)
+    Defined at /root/package/tests/subroutine_routine_external_stmt_fp.f90 lines \
+        19-44
+    
+    Parameters
+    ----------
+    invar : int32
+    
+    Returns
+    -------
+    outvar : int32
+    """
+    outvar = _subroutine_external.f90wrap_routine_call_external_stmt(invar=invar)
+    return outvar
+
+def other_external_subroutine(interface_call=False):
+    """
+    outvar = other_external_subroutine()
+    Defined at /root/package/tests/subroutine_routine_external_fp.f90 lines 4-7
+    
+    Returns
+    -------
+    outvar : int32
+    """
+    outvar = _subroutine_external.f90wrap_other_external_subroutine()
+    return outvar
+
+def other_external_function(interface_call=False):
+    """
+    outvar = other_external_function()
+    Defined at /root/package/tests/subroutine_routine_external_fp.f90 lines 9-11
+    
+    Returns
+    -------
+    outvar : int32
+    """
+    outvar = _subroutine_external.f90wrap_other_external_function()
+    return outvar
+
@@ -0,0 +1,15 @@
+! This should be tested as well with interface statements in the caller
+! routine, and the subprogram definitions outside (to have "truly external"
+! procedures, however, we need to make the INTERFACE support more robust first
+
+subroutine other_external_subroutine(outvar)
+  implicit none
+  integer, intent(out) :: outvar
+  outvar = 4
+end subroutine other_external_subroutine
+
+function other_external_function() result(outvar)
+  implicit none
+  integer :: outvar
+  outvar = 6
+end function other_external_function
\ No newline at end of file
@@ -38,6 +38,9 @@ end subroutine test_dimension_size
     assert routine.variable_map['local_arr'].dimensions[0] in dim.size_expressions
     assert routine.variable_map['range_arr'].dimensions[0] in dim.size_expressions
 
+    # Size expressions are only built once
+    assert dim.size_expressions is dim.size_expressions
+
 
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_dimension_index_range(frontend):
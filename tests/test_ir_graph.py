@@ -25,6 +25,15 @@ test_files = [
     "sources/trivial_fortran_files/nested_if_else_statements_subroutine.f90",
 ]
 
+
+@pytest.fixture(scope="module", name="sources")
+def fixture_sources(here):
+    """
+    Parse each test file only once and share it across all parametrizations,
+    since the graph tests do not modify the IR
+    """
+    return {test_file: Sourcefile.from_file(here / test_file) for test_file in test_files}
+
 solutions_default_parameters = {
     "sources/trivial_fortran_files/case_statement_subroutine.f90": {
         "node_count": 12,
@@ -189,10 +198,10 @@ def get_property(node_edge_info, name):
 @pytest.mark.parametrize("show_comments", [True, False])
 @pytest.mark.parametrize("show_expressions", [True, False])
 def test_graph_collector_node_edge_count_only(
-    here, test_file, show_comments, show_expressions
+    sources, test_file, show_comments, show_expressions
 ):
     solution = solutions_node_edge_counts[test_file]
-    source = Sourcefile.from_file(here / test_file)
+    source = sources[test_file]
 
     graph_collector = GraphCollector(
         show_comments=show_comments, show_expressions=show_expressions
@@ -219,9 +228,9 @@ def test_graph_collector_node_edge_count_only(
 
 @pytest.mark.skipif(not graphviz_present(), reason="Graphviz is not installed")
 @pytest.mark.parametrize("test_file", test_files)
-def test_graph_collector_detail(here, test_file):
+def test_graph_collector_detail(sources, test_file):
     solution = solutions_default_parameters[test_file]
-    source = Sourcefile.from_file(here / test_file)
+    source = sources[test_file]
 
     graph_collector = GraphCollector()
     node_edge_info = [item for item in graph_collector.visit(source.ir) if item is not None]
@@ -246,8 +255,8 @@ def test_graph_collector_detail(here, test_file):
 @pytest.mark.skipif(not graphviz_present(), reason="Graphviz is not installed")
 @pytest.mark.parametrize("test_file", test_files)
 @pytest.mark.parametrize("linewidth", [40, 60, 80])
-def test_graph_collector_maximum_label_length(here, test_file, linewidth):
-    source = Sourcefile.from_file(here / test_file)
+def test_graph_collector_maximum_label_length(sources, test_file, linewidth):
+    source = sources[test_file]
 
     graph_collector = GraphCollector(
         show_comments=True, show_expressions=True, linewidth=linewidth
@@ -281,9 +290,9 @@ def find_label_content_inside_nodes(input_text):
 
 @pytest.mark.skipif(not graphviz_present(), reason="Graphviz is not installed")
 @pytest.mark.parametrize("test_file", test_files)
-def test_ir_graph_writes_correct_graphs(here, test_file):
+def test_ir_graph_writes_correct_graphs(sources, test_file):
     solution = solutions_default_parameters[test_file]
-    source = Sourcefile.from_file(here / test_file)
+    source = sources[test_file]
 
     graph = ir_graph(source.ir)
 
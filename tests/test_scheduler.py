@@ -49,8 +49,8 @@ Test directory structure
 """
 
 import re
+from copy import deepcopy
 from pathlib import Path
-from shutil import rmtree
 import pytest
 
 from conftest import (available_frontends, graphviz_present)
@@ -58,7 +58,7 @@ from loki import (
     Scheduler, SchedulerConfig, DependencyTransformation, FP, OFP,
     HAVE_FP, HAVE_OFP, REGEX, Sourcefile, FindNodes, CallStatement,
     fexprgen, Transformation, BasicType, CMakePlanner, Subroutine,
-    SubroutineItem, ProcedureBindingItem, gettempdir, ProcedureSymbol,
+    SubroutineItem, ProcedureBindingItem, ProcedureSymbol,
     ProcedureType, DerivedType, TypeDef, Scalar, Array, FindInlineCalls,
     Import, Variable, GenericImportItem, GlobalVarImportItem, flatten
 )
@@ -101,30 +101,63 @@ def fixture_frontend():
     return FP if HAVE_FP else OFP
 
 
+@pytest.fixture(name='no_callgraph_render')
+def fixture_no_callgraph_render(monkeypatch):
+    """
+    Write only the DOT source of callgraphs and skip rendering the PDF.
+
+    The graph tests inspect only the DOT source, so the costly invocation of
+    the Graphviz binaries is avoided. :meth:`test_scheduler_graph_simple`
+    retains the full rendering as integration test.
+    """
+    try:
+        import graphviz as gviz  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return
+
+    def render(self, filename=None, directory=None, **kwargs):  # pylint: disable=unused-argument
+        return self.save(filename, directory=directory)
+
+    monkeypatch.setattr(gviz.Digraph, 'render', render)
+
+
 class VisGraphWrapper:
     """
     Testing utility to parse the generated callgraph visualisation.
     """
 
-    _re_nodes = re.compile(r'\s*\"?(?P<node>[\w%#./]+)\"? \[colo', re.IGNORECASE)
-    _re_edges = re.compile(r'\s*\"?(?P<parent>[\w%#./]+)\"? -> \"?(?P<child>[\w%#./]+)\"?', re.IGNORECASE)
+    _re_graph = re.compile(
+        r'\s*\"?(?:(?P<parent>[\w%#./]+)\"? -> \"?(?P<child>[\w%#./]+)\"?|(?P<node>[\w%#./]+)\"? \[colo)',
+        re.IGNORECASE
+    )
 
     def __init__(self, path):
         with Path(path).open('r') as f:
             self.text = f.read()
 
+        # Extract nodes and edges in a single sweep over the text
+        nodes = set()
+        edges = set()
+        for match in self._re_graph.finditer(self.text):
+            if match['node']:
+                nodes.add(match['node'])
+            else:
+                edges.add((match['parent'], match['child']))
+        self._nodes = frozenset(nodes)
+        self._edges = frozenset(edges)
+
     @property
     def nodes(self):
-        return list(self._re_nodes.findall(self.text))
+        return self._nodes
 
     @property
     def edges(self):
-        return list(self._re_edges.findall(self.text))
+        return self._edges
 
 
 @pytest.mark.skipif(not graphviz_present(), reason='Graphviz is not installed')
 @pytest.mark.parametrize('with_file_graph', [True, False, 'filegraph_simple'])
-def test_scheduler_graph_simple(here, config, frontend, with_file_graph):
+def test_scheduler_graph_simple(tmp_path, here, config, frontend, with_file_graph):
     """
     Create a simple task graph from a single sub-project:
 
@@ -134,9 +167,11 @@ def test_scheduler_graph_simple(here, config, frontend, with_file_graph):
     """
     projA = here/'sources/projA'
 
+    # The graph tests only inspect the dependency graph, which is
+    # built from the incremental parse and thus does not need a full parse
     scheduler = Scheduler(
         paths=projA, includes=projA/'include', config=config,
-        seed_routines=['driverA'], frontend=frontend
+        seed_routines=['driverA'], full_parse=False, frontend=frontend
     )
 
     expected_items = [
@@ -151,8 +186,9 @@ def test_scheduler_graph_simple(here, config, frontend, with_file_graph):
         ('kernelA_mod#kernelA', '#another_l1'),
         ('#another_l1', '#another_l2'),
     ]
-    assert all(n in scheduler.items for n in expected_items)
-    assert all(e in scheduler.dependencies for e in expected_dependencies)
+    assert {n.lower() for n in expected_items} == {item.name for item in scheduler.items}
+    expected = {(a.lower(), b.lower()) for a, b in expected_dependencies}
+    assert expected == {(a.name, b.name) for a, b in scheduler.dependencies}
 
     if with_file_graph:
         file_graph = scheduler.file_graph
@@ -172,33 +208,28 @@ def test_scheduler_graph_simple(here, config, frontend, with_file_graph):
         assert all((Path(a), Path(b)) in file_graph.edges for a, b in expected_file_dependencies)
 
     # Testing of callgraph visualisation
-    cg_path = here/'callgraph_simple'
+    cg_path = tmp_path/'callgraph_simple'
     if not isinstance(with_file_graph, bool):
-        with_file_graph = here/with_file_graph
+        with_file_graph = tmp_path/with_file_graph
     scheduler.callgraph(cg_path, with_file_graph=with_file_graph)
 
     vgraph = VisGraphWrapper(cg_path)
-    assert all(n.upper() in vgraph.nodes for n in expected_items)
-    assert all((e[0].upper(), e[1].upper()) in vgraph.edges for e in expected_dependencies)
+    assert {n.upper() for n in expected_items} == vgraph.nodes
+    assert {(a.upper(), b.upper()) for a, b in expected_dependencies} == vgraph.edges
 
     if with_file_graph:
         if isinstance(with_file_graph, bool):
             fg_path = cg_path.with_name(f'{cg_path.stem}_file_graph{cg_path.suffix}')
         else:
-            fg_path = here/with_file_graph
+            fg_path = with_file_graph
         fgraph = VisGraphWrapper(fg_path)
-        assert all(n in fgraph.nodes for n in expected_files)
-        assert all((e[0], e[1]) in fgraph.edges for e in expected_file_dependencies)
-
-        fg_path.unlink()
-        fg_path.with_suffix('.pdf').unlink(missing_ok=True)
-
-    cg_path.unlink()
-    cg_path.with_suffix('.pdf').unlink(missing_ok=True)
+        assert set(expected_files) == fgraph.nodes
+        assert set(expected_file_dependencies) == fgraph.edges
 
 
 @pytest.mark.skipif(not graphviz_present(), reason='Graphviz is not installed')
-def test_scheduler_graph_partial(here, config, frontend):
+@pytest.mark.usefixtures('no_callgraph_render')
+def test_scheduler_graph_partial(tmp_path, here, config, frontend):
     """
     Create a sub-graph from a select set of branches in  single project:
 
@@ -220,7 +251,9 @@ def test_scheduler_graph_partial(here, config, frontend):
         },
     ]
 
-    scheduler = Scheduler(paths=projA, includes=projA/'include', config=config, frontend=frontend)
+    scheduler = Scheduler(
+        paths=projA, includes=projA/'include', config=config, full_parse=False, frontend=frontend
+    )
 
     expected_items = [
         'compute_l1_mod#compute_l1', 'compute_l2_mod#compute_l2', '#another_l1', '#another_l2'
@@ -231,28 +264,26 @@ def test_scheduler_graph_partial(here, config, frontend):
     ]
 
     # Check the correct sub-graph is generated
-    assert all(n in scheduler.items for n in expected_items)
-    assert all(e in scheduler.dependencies for e in expected_dependencies)
+    assert {n.lower() for n in expected_items} == {item.name for item in scheduler.items}
+    expected = {(a.lower(), b.lower()) for a, b in expected_dependencies}
+    assert expected == {(a.name, b.name) for a, b in scheduler.dependencies}
     assert 'driverA' not in scheduler.items
     assert 'kernelA' not in scheduler.items
 
     # Testing of callgraph visualisation
-    cg_path = here/'callgraph_partial'
+    cg_path = tmp_path/'callgraph_partial'
     scheduler.callgraph(cg_path)
 
     vgraph = VisGraphWrapper(cg_path)
-    assert all(n.upper() in vgraph.nodes for n in expected_items)
-    assert all((e[0].upper(), e[1].upper()) in vgraph.edges for e in expected_dependencies)
+    assert {n.upper() for n in expected_items} == vgraph.nodes
+    assert {(a.upper(), b.upper()) for a, b in expected_dependencies} == vgraph.edges
     assert 'DRIVERA' not in vgraph.nodes
     assert 'KERNELA' not in vgraph.nodes
 
-    cg_path.unlink()
-    if cg_path.with_suffix('.pdf').exists():
-        cg_path.with_suffix('.pdf').unlink()
-
 
 @pytest.mark.skipif(not graphviz_present(), reason='Graphviz is not installed')
-def test_scheduler_graph_config_file(here, frontend):
+@pytest.mark.usefixtures('no_callgraph_render')
+def test_scheduler_graph_config_file(tmp_path, here, frontend):
     """
     Create a sub-graph from a branches using a config file:
 
@@ -263,35 +294,36 @@ def test_scheduler_graph_config_file(here, frontend):
     projA = here/'sources/projA'
     config = projA/'scheduler_partial.config'
 
-    scheduler = Scheduler(paths=projA, includes=projA/'include', config=config, frontend=frontend)
+    scheduler = Scheduler(
+        paths=projA, includes=projA/'include', config=config, full_parse=False, frontend=frontend
+    )
 
     expected_items = ['compute_l1_mod#compute_l1', '#another_l1', '#another_l2']
     expected_dependencies = [('#another_l1', '#another_l2')]
 
     # Check the correct sub-graph is generated
-    assert all(n in scheduler.items for n in expected_items)
-    assert all(e in scheduler.dependencies for e in expected_dependencies)
+    assert {n.lower() for n in expected_items} == {item.name for item in scheduler.items}
+    expected = {(a.lower(), b.lower()) for a, b in expected_dependencies}
+    assert expected == {(a.name, b.name) for a, b in scheduler.dependencies}
     assert 'compute_l2' not in scheduler.items  # We're blocking `compute_l2` in config file
 
     # Testing of callgraph visualisation
-    cg_path = here/'callgraph_config_file'
+    cg_path = tmp_path/'callgraph_config_file'
     scheduler.callgraph(cg_path)
 
     vgraph = VisGraphWrapper(cg_path)
-    assert all(n.upper() in vgraph.nodes for n in expected_items)
-    assert all((e[0].upper(), e[1].upper()) in vgraph.edges for e in expected_dependencies)
-    assert 'COMPUTE_L2_MOD#COMPUTE_L2' in vgraph.nodes  # We're blocking this, but it's still in the VGraph
-    assert ('COMPUTE_L1_MOD#COMPUTE_L1', 'COMPUTE_L2_MOD#COMPUTE_L2') in vgraph.edges
+    # We're blocking compute_l2, but it's still in the VGraph
+    assert {n.upper() for n in expected_items} | {'COMPUTE_L2_MOD#COMPUTE_L2'} == vgraph.nodes
+    assert {(a.upper(), b.upper()) for a, b in expected_dependencies} | {
+        ('COMPUTE_L1_MOD#COMPUTE_L1', 'COMPUTE_L2_MOD#COMPUTE_L2')
+    } == vgraph.edges
     assert len(vgraph.nodes) == 4
     assert len(vgraph.edges) == 2
 
-    cg_path.unlink()
-    if cg_path.with_suffix('.pdf').exists():
-        cg_path.with_suffix('.pdf').unlink()
-
 
 @pytest.mark.skipif(not graphviz_present(), reason='Graphviz is not installed')
-def test_scheduler_graph_blocked(here, config, frontend):
+@pytest.mark.usefixtures('no_callgraph_render')
+def test_scheduler_graph_blocked(tmp_path, here, config, frontend):
     """
     Create a simple task graph with a single branch blocked:
 
@@ -305,7 +337,7 @@ def test_scheduler_graph_blocked(here, config, frontend):
 
     scheduler = Scheduler(
         paths=projA, includes=projA/'include', config=config,
-        seed_routines=['driverA'], frontend=frontend
+        seed_routines=['driverA'], full_parse=False, frontend=frontend
     )
 
     expected_items = [
@@ -317,8 +349,9 @@ def test_scheduler_graph_blocked(here, config, frontend):
         ('compute_l1_mod#compute_l1', 'compute_l2_mod#compute_l2'),
     ]
 
-    assert all(n in scheduler.items for n in expected_items)
-    assert all(e in scheduler.dependencies for e in expected_dependencies)
+    assert {n.lower() for n in expected_items} == {item.name for item in scheduler.items}
+    expected = {(a.lower(), b.lower()) for a, b in expected_dependencies}
+    assert expected == {(a.name, b.name) for a, b in scheduler.dependencies}
 
     assert '#another_l1' not in scheduler.items
     assert '#another_l2' not in scheduler.items
@@ -326,22 +359,19 @@ def test_scheduler_graph_blocked(here, config, frontend):
     assert ('another_l1', 'another_l2') not in scheduler.dependencies
 
     # Testing of callgraph visualisation
-    cg_path = here/'callgraph_block'
+    cg_path = tmp_path/'callgraph_block'
     scheduler.callgraph(cg_path)
 
     vgraph = VisGraphWrapper(cg_path)
-    assert all(n.upper() in vgraph.nodes for n in expected_items)
-    assert all((e[0].upper(), e[1].upper()) in vgraph.edges for e in expected_dependencies)
-    assert '#ANOTHER_L1' in vgraph.nodes  # We're blocking this, but it's still in the VGraph
+    # We're blocking another_l1, but it's still in the VGraph
+    assert {n.upper() for n in expected_items} | {'#ANOTHER_L1'} == vgraph.nodes
+    assert {(a.upper(), b.upper()) for a, b in expected_dependencies} | {
+        ('KERNELA_MOD#KERNELA', '#ANOTHER_L1')
+    } == vgraph.edges
     assert '#ANOTHER_L2' not in vgraph.nodes
-    assert ('KERNELA_MOD#KERNELA', '#ANOTHER_L1') in vgraph.edges
     assert len(vgraph.nodes) == 5
     assert len(vgraph.edges) == 4
 
-    cg_path.unlink()
-    if cg_path.with_suffix('.pdf').exists():
-        cg_path.with_suffix('.pdf').unlink()
-
 
 def test_scheduler_definitions(here, config, frontend):
     """
@@ -406,10 +436,11 @@ def test_scheduler_process(here, config, frontend):
 
     # Apply re-naming transformation and check result
     scheduler.process(transformation=AppendRole())
-    assert scheduler.item_map['compute_l1_mod#compute_l1'].routine.name == 'compute_l1_driver'
-    assert scheduler.item_map['compute_l2_mod#compute_l2'].routine.name == 'compute_l2_kernel'
-    assert scheduler.item_map['#another_l1'].routine.name == 'another_l1_driver'
-    assert scheduler.item_map['#another_l2'].routine.name == 'another_l2_kernel'
+    names = {name: item.routine.name for name, item in scheduler.item_map.items()}
+    assert names['compute_l1_mod#compute_l1'] == 'compute_l1_driver'
+    assert names['compute_l2_mod#compute_l2'] == 'compute_l2_kernel'
+    assert names['#another_l1'] == 'another_l1_driver'
+    assert names['#another_l2'] == 'another_l2_kernel'
 
 
 @pytest.mark.skipif(not graphviz_present(), reason='Graphviz is not installed')
@@ -469,7 +500,8 @@ def test_scheduler_process_filter(here, config, frontend):
 
 
 @pytest.mark.skipif(not graphviz_present(), reason='Graphviz is not installed')
-def test_scheduler_graph_multiple_combined(here, config, frontend):
+@pytest.mark.usefixtures('no_callgraph_render')
+def test_scheduler_graph_multiple_combined(tmp_path, here, config, frontend):
     """
     Create a single task graph spanning two projects
 
@@ -482,7 +514,7 @@ def test_scheduler_graph_multiple_combined(here, config, frontend):
 
     scheduler = Scheduler(
         paths=[projA, projB], includes=projA/'include', config=config,
-        seed_routines=['driverB'], frontend=frontend
+        seed_routines=['driverB'], full_parse=False, frontend=frontend
     )
 
     expected_items = [
@@ -497,24 +529,22 @@ def test_scheduler_graph_multiple_combined(here, config, frontend):
         ('kernelB_mod#kernelB', 'ext_driver_mod#ext_driver'),
         ('ext_driver_mod#ext_driver', 'ext_kernel_mod#ext_kernel'),
     ]
-    assert all(n in scheduler.items for n in expected_items)
-    assert all(e in scheduler.dependencies for e in expected_dependencies)
+    assert {n.lower() for n in expected_items} == {item.name for item in scheduler.items}
+    expected = {(a.lower(), b.lower()) for a, b in expected_dependencies}
+    assert expected == {(a.name, b.name) for a, b in scheduler.dependencies}
 
     # Testing of callgraph visualisation
-    cg_path = here/'callgraph_multiple_combined'
+    cg_path = tmp_path/'callgraph_multiple_combined'
     scheduler.callgraph(cg_path)
 
     vgraph = VisGraphWrapper(cg_path)
-    assert all(n.upper() in vgraph.nodes for n in expected_items)
-    assert all((e[0].upper(), e[1].upper()) in vgraph.edges for e in expected_dependencies)
-
-    cg_path.unlink()
-    if cg_path.with_suffix('.pdf').exists():
-        cg_path.with_suffix('.pdf').unlink()
+    assert {n.upper() for n in expected_items} == vgraph.nodes
+    assert {(a.upper(), b.upper()) for a, b in expected_dependencies} == vgraph.edges
 
 
 @pytest.mark.skipif(not graphviz_present(), reason='Graphviz is not installed')
-def test_scheduler_graph_multiple_separate(here, config, frontend):
+@pytest.mark.usefixtures('no_callgraph_render')
+def test_scheduler_graph_multiple_separate(tmp_path, here, config, frontend):
     """
     Tests combining two scheduler graphs, where that an individual
     sub-branch is pruned in the driver schedule, while IPA meta-info
@@ -530,7 +560,7 @@ def test_scheduler_graph_multiple_separate(here, config, frontend):
     projA = here/'sources/projA'
     projB = here/'sources/projB'
 
-    configA = config.copy()
+    configA = deepcopy(config)
     configA['routine'] = [
         {
             'name': 'kernelB',
@@ -555,25 +585,25 @@ def test_scheduler_graph_multiple_separate(here, config, frontend):
         ('compute_l1_mod#compute_l1', 'compute_l2_mod#compute_l2'),
      ]
 
-    assert all(n in schedulerA.items for n in expected_itemsA)
-    assert all(e in schedulerA.dependencies for e in expected_dependenciesA)
+    assert {n.lower() for n in expected_itemsA} == {item.name for item in schedulerA.items}
+    expected = {(a.lower(), b.lower()) for a, b in expected_dependenciesA}
+    assert expected == {(a.name, b.name) for a, b in schedulerA.dependencies}
     # assert 'ext_driver' not in schedulerA.items
     # assert 'ext_kernel' not in schedulerA.items
 
     # Test callgraph visualisation
-    cg_path = here/'callgraph_multiple_separate_A'
+    cg_path = tmp_path/'callgraph_multiple_separate_A'
     schedulerA.callgraph(cg_path)
 
     vgraph = VisGraphWrapper(cg_path)
-    assert all(n.upper() in vgraph.nodes for n in expected_itemsA)
-    assert all((e[0].upper(), e[1].upper()) in vgraph.edges for e in expected_dependenciesA)
-
-    cg_path.unlink()
-    if cg_path.with_suffix('.pdf').exists():
-        cg_path.with_suffix('.pdf').unlink()
+    # We're ignoring ext_driver, but it's still in the VGraph
+    assert {n.upper() for n in expected_itemsA} | {'EXT_DRIVER_MOD#EXT_DRIVER'} == vgraph.nodes
+    assert {(a.upper(), b.upper()) for a, b in expected_dependenciesA} | {
+        ('KERNELB_MOD#KERNELB', 'EXT_DRIVER_MOD#EXT_DRIVER')
+    } == vgraph.edges
 
     # Test second scheduler instance that holds the receiver items
-    configB = config.copy()
+    configB = deepcopy(config)
     configB['routine'] = [
         {
             'name': 'ext_driver',
@@ -597,7 +627,7 @@ def test_scheduler_graph_multiple_separate(here, config, frontend):
     assert fexprgen(call.routine.arguments) == '(vector(:), matrix(:, :))'
 
     # Test callgraph visualisation
-    cg_path = here/'callgraph_multiple_separate_B'
+    cg_path = tmp_path/'callgraph_multiple_separate_B'
     schedulerB.callgraph(cg_path)
 
     vgraphB = VisGraphWrapper(cg_path)
@@ -605,10 +635,6 @@ def test_scheduler_graph_multiple_separate(here, config, frontend):
     assert 'EXT_KERNEL_MOD#EXT_KERNEL' in vgraphB.nodes
     assert ('EXT_DRIVER_MOD#EXT_DRIVER', 'EXT_KERNEL_MOD#EXT_KERNEL') in vgraphB.edges
 
-    cg_path.unlink()
-    if cg_path.with_suffix('.pdf').exists():
-        cg_path.with_suffix('.pdf').unlink()
-
 
 def test_scheduler_module_dependency(here, config, frontend):
     """
@@ -639,8 +665,9 @@ def test_scheduler_module_dependency(here, config, frontend):
         ('kernelC_mod#kernelC', 'proj_c_util_mod#routine_one'),
         ('proj_c_util_mod#routine_one', 'proj_c_util_mod#routine_two'),
     ]
-    assert all(n in scheduler.items for n in expected_items)
-    assert all(e in scheduler.dependencies for e in expected_dependencies)
+    assert {n.lower() for n in expected_items} == {item.name for item in scheduler.items}
+    expected = {(a.lower(), b.lower()) for a, b in expected_dependencies}
+    assert expected == {(a.name, b.name) for a, b in scheduler.dependencies}
 
     # Ensure that we got the right routines from the module
     assert scheduler.item_map['proj_c_util_mod#routine_one'].routine.name == 'routine_one'
@@ -677,8 +704,9 @@ def test_scheduler_module_dependencies_unqualified(here, config, frontend):
         ('kernelD_mod#kernelD', 'proj_c_util_mod#routine_one'),
         ('proj_c_util_mod#routine_one', 'proj_c_util_mod#routine_two'),
     ]
-    assert all(n in scheduler.items for n in expected_items)
-    assert all(e in scheduler.dependencies for e in expected_dependencies)
+    assert {n.lower() for n in expected_items} == {item.name for item in scheduler.items}
+    expected = {(a.lower(), b.lower()) for a, b in expected_dependencies}
+    assert expected == {(a.name, b.name) for a, b in scheduler.dependencies}
 
     # Ensure that we got the right routines from the module
     assert scheduler.item_map['proj_c_util_mod#routine_one'].routine.name == 'routine_one'
@@ -718,8 +746,9 @@ def test_scheduler_missing_files(here, config, frontend):
         ('kernelC_mod#kernelC', 'compute_l1_mod#compute_l1'),
         ('compute_l1_mod#compute_l1', 'compute_l2_mod#compute_l2'),
     ]
-    assert all(n in scheduler.items for n in expected_items)
-    assert all(e in scheduler.dependencies for e in expected_dependencies)
+    assert {n.lower() for n in expected_items} == {item.name for item in scheduler.items}
+    expected = {(a.lower(), b.lower()) for a, b in expected_dependencies}
+    assert expected == {(a.name, b.name) for a, b in scheduler.dependencies}
 
     # Ensure that the missing items are not in the graph
     assert 'proj_c_util_mod#routine_one' not in scheduler.items
@@ -757,32 +786,30 @@ def test_scheduler_dependencies_ignore(here, frontend):
 
     schedulerB = Scheduler(paths=projB, includes=projB/'include', config=configB, frontend=frontend)
 
-    assert all(n in schedulerA.items for n in [
-        'driverB_mod#driverB', 'kernelB_mod#kernelB',
+    assert {
+        'driverb_mod#driverb', 'kernelb_mod#kernelb',
         'compute_l1_mod#compute_l1', 'compute_l2_mod#compute_l2'
-    ])
+    } == {item.name for item in schedulerA.items}
     assert 'ext_driver_mod#ext_driver' not in schedulerA.items
     assert 'ext_kernel_mod#ext_kernel' not in schedulerA.items
 
-    assert all(n in schedulerB.items for n in ['ext_driver_mod#ext_driver', 'ext_kernel_mod#ext_kernel'])
+    assert {'ext_driver_mod#ext_driver', 'ext_kernel_mod#ext_kernel'} == {item.name for item in schedulerB.items}
 
     # Apply dependency injection transformation and ensure only the root driver is not transformed
     dependency = DependencyTransformation(suffix='_test', mode='module', module_suffix='_mod')
     schedulerA.process(transformation=dependency)
 
-    assert schedulerA.items[0].source.all_subroutines[0].name == 'driverB'
-    assert schedulerA.items[1].source.all_subroutines[0].name == 'kernelB_test'
-    assert schedulerA.items[2].source.all_subroutines[0].name == 'compute_l1_test'
-    assert schedulerA.items[3].source.all_subroutines[0].name == 'compute_l2_test'
+    names = [item.source.all_subroutines[0].name for item in schedulerA.items]
+    assert names[:4] == ['driverB', 'kernelB_test', 'compute_l1_test', 'compute_l2_test']
 
     # For the second target lib, we want the driver to be converted
     schedulerB.process(transformation=dependency)
+    names = [item.source.all_subroutines[0].name for item in schedulerB.items]
+    assert names[:2] == ['ext_driver_test', 'ext_kernel_test']
 
     # Repeat processing to ensure DependencyTransform is idempotent
     schedulerB.process(transformation=dependency)
-
-    assert schedulerB.items[0].source.all_subroutines[0].name == 'ext_driver_test'
-    assert schedulerB.items[1].source.all_subroutines[0].name == 'ext_kernel_test'
+    assert [item.source.all_subroutines[0].name for item in schedulerB.items] == names
 
 
 def test_scheduler_cmake_planner(here, frontend):
@@ -954,8 +981,8 @@ def test_scheduler_item_children(here):
     assert not scheduler.item_map['subroutines_mod#device2'].children
 
 
-@pytest.fixture(name='loki_69_dir')
-def fixture_loki_69_dir(here):
+@pytest.fixture(scope='module', name='loki_69_dir')
+def fixture_loki_69_dir(tmp_path_factory):
     """
     Fixture to write test file for LOKI-69 test.
     """
@@ -1009,16 +1036,9 @@ implicit none
 end subroutine test
     """.strip()
 
-    dirname = here/'loki69'
-    dirname.mkdir(exist_ok=True)
-    filename = dirname/'test.F90'
-    filename.write_text(fcode)
-    yield dirname
-    try:
-        filename.unlink()
-        dirname.rmdir()
-    except FileNotFoundError:
-        pass
+    dirname = tmp_path_factory.mktemp('loki69')
+    (dirname/'test.F90').write_text(fcode)
+    return dirname
 
 
 def test_scheduler_loki_69(loki_69_dir):
@@ -1046,7 +1066,8 @@ def test_scheduler_loki_69(loki_69_dir):
 
 
 @pytest.mark.skipif(not graphviz_present(), reason='Graphviz is not installed')
-def test_scheduler_scopes(here, config, frontend):
+@pytest.mark.usefixtures('no_callgraph_render')
+def test_scheduler_scopes(tmp_path, here, config, frontend):
     """
     Test discovery with import renames and duplicate names in separate scopes
 
@@ -1072,15 +1093,12 @@ def test_scheduler_scopes(here, config, frontend):
     assert expected_dependencies == {(e[0].name, e[1].name) for e in scheduler.dependencies}
 
     # Testing of callgraph visualisation
-    cg_path = here/'callgraph_scopes'
+    cg_path = tmp_path/'callgraph_scopes'
     scheduler.callgraph(cg_path)
 
     vgraph = VisGraphWrapper(cg_path)
-    assert all(n.upper() in vgraph.nodes for n in expected_items)
-    assert all((e[0].upper(), e[1].upper()) in vgraph.edges for e in expected_dependencies)
-
-    cg_path.unlink()
-    cg_path.with_suffix('.pdf').unlink()
+    assert {n.upper() for n in expected_items} == vgraph.nodes
+    assert {(a.upper(), b.upper()) for a, b in expected_dependencies} == vgraph.edges
 
 
 def test_scheduler_typebound_item(here):
@@ -1226,7 +1244,8 @@ def test_scheduler_typebound_item(here):
 
 
 @pytest.mark.skipif(not graphviz_present(), reason='Graphviz is not installed')
-def test_scheduler_typebound(here, config, frontend):
+@pytest.mark.usefixtures('no_callgraph_render')
+def test_scheduler_typebound(tmp_path, here, config, frontend):
     """
     Test correct dependency chasing for typebound procedure calls.
 
@@ -1296,19 +1315,17 @@ def test_scheduler_typebound(here, config, frontend):
     assert expected_dependencies == {(e[0].name, e[1].name) for e in scheduler.dependencies}
 
     # Testing of callgraph visualisation
-    cg_path = here/'callgraph_typebound'
+    cg_path = tmp_path/'callgraph_typebound'
     scheduler.callgraph(cg_path)
 
     vgraph = VisGraphWrapper(cg_path)
-    assert all(n.upper() in vgraph.nodes for n in expected_items)
-    assert all((e[0].upper(), e[1].upper()) in vgraph.edges for e in expected_dependencies)
-
-    cg_path.unlink()
-    cg_path.with_suffix('.pdf').unlink()
+    assert {n.upper() for n in expected_items} == vgraph.nodes
+    assert {(a.upper(), b.upper()) for a, b in expected_dependencies} == vgraph.edges
 
 
 @pytest.mark.skipif(not graphviz_present(), reason='Graphviz is not installed')
-def test_scheduler_typebound_ignore(here, config, frontend):
+@pytest.mark.usefixtures('no_callgraph_render')
+def test_scheduler_typebound_ignore(tmp_path, here, config, frontend):
     """
     Test correct dependency chasing for typebound procedure calls with ignore working for
     typebound procedures correctly.
@@ -1326,7 +1343,7 @@ def test_scheduler_typebound_ignore(here, config, frontend):
     """
     proj = here/'sources/projTypeBound'
 
-    my_config = config.copy()
+    my_config = deepcopy(config)
     my_config['default']['disable'] += ['some_type%some_routine', 'header_member_routine']
     my_config['routine'] = [
         {
@@ -1378,15 +1395,12 @@ def test_scheduler_typebound_ignore(here, config, frontend):
     assert expected_dependencies == {(e[0].name, e[1].name) for e in scheduler.dependencies}
 
     # Testing of callgraph visualisation
-    cg_path = here/'callgraph_typebound'
+    cg_path = tmp_path/'callgraph_typebound'
     scheduler.callgraph(cg_path)
 
     vgraph = VisGraphWrapper(cg_path)
-    assert all(n.upper() in vgraph.nodes for n in expected_items)
-    assert all((e[0].upper(), e[1].upper()) in vgraph.edges for e in expected_dependencies)
-
-    cg_path.unlink()
-    cg_path.with_suffix('.pdf').unlink()
+    assert {n.upper() for n in expected_items} == vgraph.nodes
+    assert {(a.upper(), b.upper()) for a, b in expected_dependencies} == vgraph.edges
 
 
 @pytest.mark.parametrize('use_file_graph', [False, True])
@@ -1444,7 +1458,7 @@ def test_scheduler_traversal_order(here, config, frontend, use_file_graph, rever
 
 @pytest.mark.parametrize('use_file_graph', [False, True])
 @pytest.mark.parametrize('reverse', [False, True])
-def test_scheduler_member_routines(config, frontend, use_file_graph, reverse):
+def test_scheduler_member_routines(tmp_path, config, frontend, use_file_graph, reverse):
     """
     Make sure that transformation processing works also for contained member routines
 
@@ -1472,8 +1486,8 @@ contains
 end module member_mod
     """.strip()
 
-    workdir = gettempdir()/'test_scheduler_member_routines'
-    workdir.mkdir(exist_ok=True)
+    workdir = tmp_path/'test_scheduler_member_routines'
+    workdir.mkdir()
     (workdir/'member_mod.F90').write_text(fcode_mod)
 
     scheduler = Scheduler(paths=[workdir], config=config, seed_routines=['driver'], frontend=frontend)
@@ -1518,11 +1532,9 @@ end module member_mod
 
     assert transformation.record == flatten(expected)
 
-    rmtree(workdir)
-
 
 @pytest.mark.parametrize('frontend', available_frontends())
-def test_scheduler_nested_type_enrichment(frontend, config):
+def test_scheduler_nested_type_enrichment(tmp_path, frontend, config):
     """
     Make sure that enrichment works correctly for nested types across
     multiple source files
@@ -1627,8 +1639,8 @@ subroutine driver
 end subroutine driver
     """.strip()
 
-    workdir = gettempdir()/'test_scheduler_nested_type_enrichment'
-    workdir.mkdir(exist_ok=True)
+    workdir = tmp_path/'test_scheduler_nested_type_enrichment'
+    workdir.mkdir()
     (workdir/'typebound_procedure_calls_mod.F90').write_text(fcode1)
     (workdir/'other_typebound_procedure_calls_mod.F90').write_text(fcode2)
     (workdir/'driver.F90').write_text(fcode3)
@@ -1680,8 +1692,6 @@ end subroutine driver
         assert call.function.parent.parent.type.dtype.name == 'third_type'
         assert isinstance(call.function.parent.parent.type.dtype.typedef, TypeDef)
 
-    rmtree(workdir)
-
 
 def test_scheduler_qualify_names():
     """
@@ -1722,7 +1732,7 @@ def test_scheduler_inline_call(here, config, frontend):
     Test that inline function calls declared via an explicit interface are added as dependencies.
     """
 
-    my_config = config.copy()
+    my_config = deepcopy(config)
     my_config['default']['enable_imports'] = True
     my_config['routine'] = [
         {
@@ -1751,12 +1761,13 @@ def test_scheduler_inline_call(here, config, frontend):
 
 
 @pytest.mark.parametrize('frontend', available_frontends())
-def test_scheduler_import_dependencies(here, config, frontend):
+@pytest.mark.usefixtures('no_callgraph_render')
+def test_scheduler_import_dependencies(tmp_path, here, config, frontend):
     """
     Test that import dependencies are correctly classified.
     """
 
-    my_config = config.copy()
+    my_config = deepcopy(config)
     my_config['default']['enable_imports'] = True
     my_config['routine'] = [
         {
@@ -1797,16 +1808,14 @@ def test_scheduler_import_dependencies(here, config, frontend):
             assert isinstance(i, SubroutineItem)
 
     # Testing of callgraph visualisation with imports
-    workdir = gettempdir()/'test_scheduler_import_dependencies'
-    workdir.mkdir(exist_ok=True)
+    workdir = tmp_path/'test_scheduler_import_dependencies'
+    workdir.mkdir()
     cg_path = workdir/'callgraph'
     scheduler.callgraph(cg_path)
 
     vgraph = VisGraphWrapper(cg_path)
-    assert all(n.upper() in vgraph.nodes for n in expected_items)
-    assert all((e[0].upper(), e[1].upper()) in vgraph.edges for e in expected_dependencies)
-
-    rmtree(workdir)
+    assert {n.upper() for n in expected_items} == vgraph.nodes
+    assert {(a.upper(), b.upper()) for a, b in expected_dependencies} == vgraph.edges
 
 
 def test_scheduler_globalvarimportitem_id(here, config, frontend):
@@ -1814,7 +1823,7 @@ def test_scheduler_globalvarimportitem_id(here, config, frontend):
     Test that scheduler.item_successors always returns the original item.
     """
 
-    my_config = config.copy()
+    my_config = deepcopy(config)
     my_config['default']['enable_imports'] = True
     my_config['routine'] = [
         {
@@ -1872,7 +1881,7 @@ subroutine some_routine()
 end subroutine some_routine
     """
 
-    my_config = config.copy()
+    my_config = deepcopy(config)
     my_config['default']['enable_imports'] = True
 
     kernel = Sourcefile.from_source(fcode_kernel, frontend=REGEX)
@@ -1890,7 +1899,7 @@ end subroutine some_routine
     assert not var_item.children
 
 
-def test_scheduler_successors(config):
+def test_scheduler_successors(tmp_path, config):
     fcode_mod = """
 module some_mod
     implicit none
@@ -1964,8 +1973,8 @@ end subroutine caller
                 expected_successors = set()
             assert expected_successors == set(successors)
 
-    workdir = gettempdir()/'test_scheduler_successors'
-    workdir.mkdir(exist_ok=True)
+    workdir = tmp_path/'test_scheduler_successors'
+    workdir.mkdir()
     (workdir/'some_mod.F90').write_text(fcode_mod)
     (workdir/'caller.F90').write_text(fcode)
 
@@ -1981,11 +1990,10 @@ end subroutine caller
         'other': 1,
     }
 
-    rmtree(workdir)
-
 
 @pytest.mark.parametrize('full_parse', [True, False])
-def test_scheduler_add_dependencies(config, full_parse):
+@pytest.mark.usefixtures('no_callgraph_render')
+def test_scheduler_add_dependencies(tmp_path, config, full_parse):
     fcode_mod = """
 module some_mod
     implicit none
@@ -2020,16 +2028,17 @@ subroutine caller(b)
 end subroutine caller
     """.strip()
 
-    workdir = gettempdir()/'test_scheduler_add_dependencies'
-    workdir.mkdir(exist_ok=True)
+    workdir = tmp_path/'test_scheduler_add_dependencies'
+    workdir.mkdir()
     (workdir/'some_mod.F90').write_text(fcode_mod)
     (workdir/'caller.F90').write_text(fcode_caller)
 
     def verify_graph(scheduler, expected_items, expected_dependencies):
         assert len(scheduler.items) == len(expected_items)
-        assert all(n in scheduler.items for n in expected_items)
+        assert {n.lower() for n in expected_items} == {item.name for item in scheduler.items}
         assert len(scheduler.dependencies) == len(expected_dependencies)
-        assert all(e in scheduler.dependencies for e in expected_dependencies)
+        expected = {(a.lower(), b.lower()) for a, b in expected_dependencies}
+        assert expected == {(a.name, b.name) for a, b in scheduler.dependencies}
 
         assert all(item.source._incomplete is not full_parse for item in scheduler.items)
 
@@ -2038,8 +2047,8 @@ end subroutine caller
         scheduler.callgraph(cg_path)
 
         vgraph = VisGraphWrapper(cg_path)
-        assert all(n.upper() in vgraph.nodes for n in expected_items)
-        assert all((e[0].upper(), e[1].upper()) in vgraph.edges for e in expected_dependencies)
+        assert {n.upper() for n in expected_items} == vgraph.nodes
+        assert {(a.upper(), b.upper()) for a, b in expected_dependencies} == vgraph.edges
 
     scheduler = Scheduler(paths=[workdir], config=config, seed_routines=['caller'], full_parse=full_parse)
 
@@ -2070,8 +2079,6 @@ end subroutine caller
     ]
     verify_graph(scheduler, expected_items, expected_dependencies)
 
-    rmtree(workdir)
-
 
 def test_scheduler_cached_properties():
     fcode = """
@@ -2104,7 +2111,7 @@ end subroutine some_routine
 
 
 @pytest.mark.parametrize('full_parse', [False, True])
-def test_scheduler_cycle(config, full_parse):
+def test_scheduler_cycle(tmp_path, config, full_parse):
     fcode_mod = """
 module some_mod
     implicit none
@@ -2149,8 +2156,8 @@ subroutine caller
 end subroutine caller
     """.strip()
 
-    workdir = gettempdir()/'test_scheduler_cycle'
-    workdir.mkdir(exist_ok=True)
+    workdir = tmp_path/'test_scheduler_cycle'
+    workdir.mkdir()
     (workdir/'some_mod.F90').write_text(fcode_mod)
     (workdir/'caller.F90').write_text(fcode_caller)
 
@@ -2165,15 +2172,13 @@ end subroutine caller
     assert (scheduler['some_mod#some_proc'], scheduler['some_mod#some_type%other']) in scheduler.dependencies
     assert (scheduler['some_mod#some_type%other'], scheduler['some_mod#some_other']) in scheduler.dependencies
 
-    rmtree(workdir)
-
 
 def test_scheduler_unqualified_imports(config):
     """
     Test that only qualified imports are added as children.
     """
 
-    my_config = config.copy()
+    my_config = deepcopy(config)
     my_config['default']['enable_imports'] = True
 
     kernel = """
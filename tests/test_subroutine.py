@@ -17,7 +17,7 @@ from loki import (
     SymbolAttributes, StringLiteral, fgen, fexprgen, VariableDeclaration,
     Transformer, FindTypedSymbols, ProcedureSymbol, ProcedureType,
     StatementFunction, normalize_range_indexing, DeferredTypeSymbol,
-    Assignment, Interface
+    Assignment, Interface, CaseInsensitiveDict
 )
 
 
@@ -2056,6 +2056,46 @@ def test_enrich_calls_explicit_interface(frontend):
     assert calls[0].routine is kernel
 
 
+@pytest.mark.parametrize('frontend', available_frontends())
+def test_enrich_calls_routine_map(frontend):
+    """
+    Test enrich_calls with a pre-built routine map that is shared between
+    several calling routines.
+    """
+
+    fcode = """
+module enrich_mod
+implicit none
+contains
+    subroutine kernel(a)
+    integer, intent(inout) :: a
+    a = a + 1
+    end subroutine kernel
+
+    subroutine driver_a(a)
+    integer, intent(inout) :: a
+    call kernel(a)
+    end subroutine driver_a
+
+    subroutine driver_b(a)
+    integer, intent(inout) :: a
+    call KERNEL(a)
+    end subroutine driver_b
+end module enrich_mod
+    """
+
+    module = Module.from_source(fcode, frontend=frontend)
+    kernel = module['kernel']
+    routine_map = CaseInsensitiveDict((r.name, r) for r in (kernel,))
+
+    for name in ('driver_a', 'driver_b'):
+        driver = module[name]
+        driver.enrich_calls(routines=(kernel,), routine_map=routine_map)
+        calls = FindNodes(CallStatement).visit(driver.body)
+        assert len(calls) == 1
+        assert calls[0].routine is kernel
+
+
 @pytest.mark.parametrize('frontend', available_frontends(
     xfail=[(OMNI, 'OMNI cannot handle external type defs without source')]
 ))
@@ -39,8 +39,9 @@ end subroutine transform_associates_simple
     routine = Subroutine.from_source(fcode, frontend=frontend)
 
     assert len(FindNodes(Associate).visit(routine.body)) == 1
-    assert len(FindNodes(Assignment).visit(routine.body)) == 1
-    assign = FindNodes(Assignment).visit(routine.body)[0]
+    assigns = FindNodes(Assignment).visit(routine.body)
+    assert len(assigns) == 1
+    assign = assigns[0]
     assert assign.rhs == 'a' and 'some_obj' not in assign.rhs
     assert assign.rhs.type.dtype == BasicType.DEFERRED
 
@@ -48,8 +49,9 @@ end subroutine transform_associates_simple
     resolve_associates(routine)
 
     assert len(FindNodes(Associate).visit(routine.body)) == 0
-    assert len(FindNodes(Assignment).visit(routine.body)) == 1
-    assign = FindNodes(Assignment).visit(routine.body)[0]
+    assigns = FindNodes(Assignment).visit(routine.body)
+    assert len(assigns) == 1
+    assign = assigns[0]
     assert assign.rhs == 'some_obj%a'
     assert assign.rhs.parent == 'some_obj'
     assert assign.rhs.type.dtype == BasicType.DEFERRED
@@ -83,8 +85,9 @@ end subroutine transform_associates_nested
     routine = Subroutine.from_source(fcode, frontend=frontend)
 
     assert len(FindNodes(Associate).visit(routine.body)) == 3
-    assert len(FindNodes(Assignment).visit(routine.body)) == 1
-    assign = FindNodes(Assignment).visit(routine.body)[0]
+    assigns = FindNodes(Assignment).visit(routine.body)
+    assert len(assigns) == 1
+    assign = assigns[0]
     assert assign.lhs == 'rick' and assign.rhs == 'a'
     assert assign.rhs.type.dtype == BasicType.DEFERRED
 
@@ -92,8 +95,9 @@ end subroutine transform_associates_nested
     resolve_associates(routine)
 
     assert len(FindNodes(Associate).visit(routine.body)) == 0
-    assert len(FindNodes(Assignment).visit(routine.body)) == 1
-    assign = FindNodes(Assignment).visit(routine.body)[0]
+    assigns = FindNodes(Assignment).visit(routine.body)
+    assert len(assigns) == 1
+    assign = assigns[0]
     assert assign.rhs == 'some_obj%never%gonna%give%you%up'
 
 
@@ -125,8 +129,9 @@ end subroutine transform_associates_simple
     routine = Subroutine.from_source(fcode, frontend=frontend)
 
     assert len(FindNodes(Associate).visit(routine.body)) == 1
-    assert len(FindNodes(CallStatement).visit(routine.body)) == 1
-    call = FindNodes(CallStatement).visit(routine.body)[0]
+    calls = FindNodes(CallStatement).visit(routine.body)
+    assert len(calls) == 1
+    call = calls[0]
     assert call.kwarguments[0][1] == 'some_array(i)%n'
     assert call.kwarguments[0][1].type.dtype == BasicType.DEFERRED
 
@@ -134,8 +139,9 @@ end subroutine transform_associates_simple
     resolve_associates(routine)
 
     assert len(FindNodes(Associate).visit(routine.body)) == 0
-    assert len(FindNodes(CallStatement).visit(routine.body)) == 1
-    call = FindNodes(CallStatement).visit(routine.body)[0]
+    calls = FindNodes(CallStatement).visit(routine.body)
+    assert len(calls) == 1
+    call = calls[0]
     assert call.kwarguments[0][1] == 'some_obj%some_array(i)%n'
     assert call.kwarguments[0][1].scope == routine
     assert call.kwarguments[0][1].type.dtype == BasicType.DEFERRED
@@ -179,8 +185,9 @@ end subroutine transform_associates_nested_conditional
 
     assert len(FindNodes(Conditional).visit(routine.body)) == 2
     assert len(FindNodes(Associate).visit(routine.body)) == 1
-    assert len(FindNodes(Assignment).visit(routine.body)) == 3
-    assign = FindNodes(Assignment).visit(routine.body)[1]
+    assigns = FindNodes(Assignment).visit(routine.body)
+    assert len(assigns) == 3
+    assign = assigns[1]
     assert assign.rhs == 'a' and 'some_obj' not in assign.rhs
     assert assign.rhs.type.dtype == BasicType.DEFERRED
 
@@ -189,8 +196,9 @@ end subroutine transform_associates_nested_conditional
 
     assert len(FindNodes(Conditional).visit(routine.body)) == 2
     assert len(FindNodes(Associate).visit(routine.body)) == 0
-    assert len(FindNodes(Assignment).visit(routine.body)) == 3
-    assign = FindNodes(Assignment).visit(routine.body)[1]
+    assigns = FindNodes(Assignment).visit(routine.body)
+    assert len(assigns) == 3
+    assign = assigns[1]
     assert assign.rhs == 'some_obj%a'
     assert assign.rhs.parent == 'some_obj'
     assert assign.rhs.type.dtype == BasicType.DEFERRED
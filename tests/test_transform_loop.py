@@ -14,6 +14,7 @@ from conftest import jit_compile, clean_test, available_frontends
 from loki import Subroutine, OMNI, FindNodes, Loop, Conditional, Scope, Assignment
 from loki.frontend.fparser import parse_fparser_expression, HAVE_FP
 from loki.transform import loop_interchange, loop_fusion, loop_fission, Polyhedron, normalize_range_indexing
+from loki.transform.transform_loop import eliminate_variable
 from loki.expression import symbols as sym
 from loki.pragma_utils import is_loki_pragma, pragmas_attached
 
@@ -110,6 +111,24 @@ def test_polyhedron_bounds(A, b, variable_names, lower_bounds, upper_bounds):
         assert all(str(b1) == b2 for b1, b2 in zip(ubounds, ref_bounds))
 
 
+@pytest.mark.parametrize('A, b, variable, ref_A, ref_b', [
+    # do i=0,5: do j=i,7: ... (eliminate i)
+    ([[-1, 0], [1, 0], [1, -1], [0, 1]], [0, 5, 0, 7], 0, [[1], [0], [-1]], [7, 5, 0]),
+    # i >= 1, i >= j, i >= 2*j-3, i <= n, i <= 2*n (eliminate i, more combinations than constraints)
+    ([[-1, 0, 0], [-1, 1, 0], [-1, 2, 0], [1, 0, -1], [2, 0, -2]], [-1, 0, 3, 0, 0], 0,
+     [[0, -1], [0, -2], [1, -1], [2, -2], [2, -1], [4, -2]], [-1, -2, 0, 0, 3, 6]),
+    # do i=1,n: ... (eliminate n, no upper bounds on n)
+    ([[-1, 0], [1, -1]], [-1, 0], 1, [[-1]], [-1]),
+])
+def test_polyhedron_eliminate_variable(A, b, variable, ref_A, ref_b):
+    """
+    Test the Fourier-Motzkin elimination of a variable from a polyhedron.
+    """
+    p = eliminate_variable(Polyhedron(A, b), variable)
+    assert np.all(p.A == np.array(ref_A, dtype=np.dtype(int)))
+    assert np.all(p.b == np.array(ref_b, dtype=np.dtype(int)))
+
+
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_transform_loop_interchange_plain(here, frontend):
     """
@@ -516,6 +535,49 @@ end subroutine transform_loop_fuse_failures
     with pytest.raises(RuntimeError):
         loop_fusion(routine)
 
+    # Loop ranges are validated even if the fused range is given
+    fcode = """
+subroutine transform_loop_fuse_failures_step(a, b, n)
+  integer, intent(out) :: a(n), b(n)
+  integer, intent(in) :: n
+  integer :: i
+
+  !$loki loop-fusion group(1) range(1:n)
+  do i=1,n,2
+    a(i) = i
+  end do
+
+  !$loki loop-fusion group(1) range(1:n)
+  do i=1,n
+    b(i) = n-i
+  end do
+end subroutine transform_loop_fuse_failures_step
+"""
+    routine = Subroutine.from_source(fcode, frontend=frontend)
+    with pytest.raises(AssertionError):
+        loop_fusion(routine)
+
+    fcode = """
+subroutine transform_loop_fuse_failures_affine(a, b, n)
+  integer, intent(out) :: a(n*n), b(n*n)
+  integer, intent(in) :: n
+  integer :: i
+
+  !$loki loop-fusion group(1) range(1:n*n)
+  do i=1,n*n
+    a(i) = i
+  end do
+
+  !$loki loop-fusion group(1) range(1:n*n)
+  do i=1,n*n
+    b(i) = n-i
+  end do
+end subroutine transform_loop_fuse_failures_affine
+"""
+    routine = Subroutine.from_source(fcode, frontend=frontend)
+    with pytest.raises(ValueError):
+        loop_fusion(routine)
+
 
 @pytest.mark.parametrize('frontend', available_frontends())
 def test_transform_loop_fuse_alignment(here, frontend):
@@ -0,0 +1,10 @@
+MODULE transform_inline_constant_parameters_kind_mod_
+  IMPLICIT NONE
+  CONTAINS
+  SUBROUTINE transform_inline_constant_parameters_kind (v1)
+    ! Loki: parameters from kind_parameters_mod inlined
+    REAL(KIND=SELECTED_REAL_KIND(13, 300)), INTENT(OUT) :: v1
+    
+    v1 = REAL(2, kind=SELECTED_REAL_KIND(13, 300)) + 3.
+  END SUBROUTINE transform_inline_constant_parameters_kind
+END MODULE transform_inline_constant_parameters_kind_mod_
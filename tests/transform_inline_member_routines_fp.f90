@@ -0,0 +1,32 @@
+SUBROUTINE member_routines (a, b)
+  REAL(KIND=8), INTENT(INOUT) :: a(3), b(3)
+  INTEGER :: i
+  INTEGER :: n
+  
+  DO i=1,SIZE(a)
+    ! [Loki] inlined member subroutine: add_one
+    ! =========================================
+    a(i) = a(i) + 1
+    ! =========================================
+  END DO
+  
+  ! [Loki] inlined member subroutine: add_to_a
+  ! =========================================
+  
+  n = SIZE(a)
+  DO i=1,n
+    a(i) = a(i) + b(i)
+  END DO
+  ! =========================================
+  
+  DO i=1,SIZE(a)
+    ! [Loki] inlined member subroutine: add_one
+    ! =========================================
+    a(i) = a(i) + 1
+    ! =========================================
+  END DO
+  
+  CONTAINS
+  
+  
+END SUBROUTINE member_routines